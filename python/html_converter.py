@@ -9,9 +9,13 @@ import re
 import json
 import argparse
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 from bs4 import BeautifulSoup, Tag
 import uuid
 import sys
@@ -21,6 +25,31 @@ from datetime import datetime
 # --- Constants ---
 APP_VERSION = "1.0.3" # Initial version for HTML converter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the C-backed lxml parser, fall back to the pure-Python parser if it is not installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Block-level tags that make up the body of a Google Docs HTML export
+BLOCK_TAGS = ['h1', 'h2', 'h3', 'p', 'ul', 'ol', 'table', 'pre', 'blockquote', 'hr', 'div']
+# Elements normalized by HTMLConverter._clean_tag
+_CLEANUP_TAGS = frozenset(('span', 'p', 'div'))
+
+# Time estimate weights, based on user data: ~10-15 seconds per article + ~2 seconds per image
+AVG_SECONDS_PER_ARTICLE = 12.5
+AVG_SECONDS_PER_IMAGE = 2.0
+# Minimum seconds between progress lines printed to the console
+PROGRESS_PRINT_INTERVAL = 0.25
+# Threads used to write article files and copy images in parallel; the work is I/O bound
+OUTPUT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 # --- Logging Setup ---
 class Colors:
     HEADER = '\033[95m'
@@ -33,6 +62,14 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Don't emit ANSI escape codes when output is redirected to a file or pipe
+if not sys.stdout.isatty():
+    for _attr in [name for name in vars(Colors) if not name.startswith('_')]:
+        setattr(Colors, _attr, '')
+
+# Separator line framing headers
+HEADER_BAR = f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}"
+
 class ProgressLogger:
     """Enhanced logging with progress indicators"""
     
@@ -49,6 +86,8 @@ class ProgressLogger:
         self.current_article = 0
         self.processed_articles = 0
         self.processed_images = 0
+        self._last_print = float('-inf')
+        self.set_totals(manuals=0)
     
     def setup_logging(self):
         """Configure logging with file and console handlers"""
@@ -73,53 +112,66 @@ class ProgressLogger:
         console_formatter = logging.Formatter('%(message)s')
         console_handler.setFormatter(console_formatter)
         
+        # File writes happen on a background thread; logging calls only enqueue the record
+        log_queue = queue.SimpleQueue()
+        self._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._listener.start()
+        
         # Configure root logger
         logger = logging.getLogger()
         logger.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
+        logger.addHandler(QueueHandler(log_queue))
         logger.addHandler(console_handler)
         
+        self.logger = logger
         self.log_file = log_file
     
+    def close(self):
+        """Flush pending records to the log file, stop the background writer and close the file"""
+        if self._listener is not None:
+            self._listener.stop()
+            # stop() only drains the queue; the file handler it wrote to is still open
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+    
     def header(self, message: str):
         """Print a header message"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{message.center(70)}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}\n")
-        logging.info(f"HEADER: {message}")
+        print(f"\n{HEADER_BAR}\n{Colors.HEADER}{Colors.BOLD}{message.center(70)}{Colors.ENDC}\n{HEADER_BAR}\n")
+        self.logger.info("HEADER: %s", message)
     
     def success(self, message: str):
         """Print a success message"""
         print(f"{Colors.OKGREEN}✓ {message}{Colors.ENDC}")
-        logging.info(f"SUCCESS: {message}")
+        self.logger.info("SUCCESS: %s", message)
     
     def info(self, message: str):
         """Print an info message"""
         if self.verbose:
             print(f"{Colors.OKCYAN}ℹ {message}{Colors.ENDC}")
-        logging.info(message)
+        self.logger.info(message)
     
     def warning(self, message: str):
         """Print a warning message"""
         print(f"{Colors.WARNING}⚠ {message}{Colors.ENDC}")
-        logging.warning(message)
+        self.logger.warning(message)
     
     def error(self, message: str):
         """Print an error message"""
         print(f"{Colors.FAIL}✗ {message}{Colors.ENDC}")
-        logging.error(message)
+        self.logger.error(message)
     
     def step(self, step_num: int, total_steps: int, message: str):
         """Print a step progress message"""
         print(f"{Colors.OKBLUE}[{step_num}/{total_steps}] {message}{Colors.ENDC}")
-        logging.info(f"STEP [{step_num}/{total_steps}]: {message}")
+        self.logger.info("STEP [%d/%d]: %s", step_num, total_steps, message)
     
     def substep(self, message: str, indent: int = 1):
         """Print a sub-step message"""
         if self.verbose:
             indent_str = "  " * indent
             print(f"{indent_str}→ {message}")
-        logging.debug(f"SUBSTEP: {message}")
+        self.logger.debug("SUBSTEP: %s", message)
     
     def set_totals(self, manuals: int = 1, chapters: int = 0, articles: int = 0, images: int = 0):
         """Set total counts for progress tracking"""
@@ -127,12 +179,18 @@ class ProgressLogger:
         self.total_chapters = chapters
         self.total_articles = articles
         self.total_images = images
+        # Precompute the per-item percentage factors used by get_progress_string
+        self._manual_pct = 100.0 / manuals if manuals > 0 else 0.0
+        self._chapter_pct = 100.0 / chapters if chapters > 0 else 0.0
+        self._article_pct = 100.0 / articles if articles > 0 else 0.0
+        # Estimated total work in seconds; remaining time is derived by subtraction
+        self._total_est_seconds = articles * AVG_SECONDS_PER_ARTICLE + images * AVG_SECONDS_PER_IMAGE
     
     def get_progress_string(self) -> str:
         """Generate progress percentage string"""
-        manual_pct = (self.current_manual / self.total_manuals * 100) if self.total_manuals > 0 else 0
-        chapter_pct = (self.current_chapter / self.total_chapters * 100) if self.total_chapters > 0 else 0
-        article_pct = (self.current_article / self.total_articles * 100) if self.total_articles > 0 else 0
+        manual_pct = self.current_manual * self._manual_pct
+        chapter_pct = self.current_chapter * self._chapter_pct
+        article_pct = self.current_article * self._article_pct
         return f"[ Manual: {manual_pct:.0f}%, Chapter: {chapter_pct:.0f}%, Article: {article_pct:.0f}% ]"
     
     def estimate_time_remaining(self) -> str:
@@ -140,21 +198,10 @@ class ProgressLogger:
         if self.processed_articles == 0:
             return "Calculating..."
         
-        elapsed = time.time() - self.start_time
-        
-        # Use weighted formula: articles are primary driver, images add time
-        # Based on user data: ~10-15 seconds per article + ~2 seconds per image
-        avg_time_per_article = 12.5  # seconds
-        avg_time_per_image = 2.0     # seconds
-        
-        # Calculate estimated total time
-        estimated_total = (self.total_articles * avg_time_per_article) + (self.total_images * avg_time_per_image)
-        
-        # Calculate progress-based estimate
-        articles_remaining = self.total_articles - self.processed_articles
-        images_remaining = self.total_images - self.processed_images
-        
-        estimated_remaining = (articles_remaining * avg_time_per_article) + (images_remaining * avg_time_per_image)
+        # Weighted estimate: articles are the primary driver, images add time
+        estimated_remaining = self._total_est_seconds - (
+            self.processed_articles * AVG_SECONDS_PER_ARTICLE + self.processed_images * AVG_SECONDS_PER_IMAGE
+        )
         
         # Format time
         minutes, seconds = divmod(int(estimated_remaining), 60)
@@ -167,27 +214,86 @@ class ProgressLogger:
         """Print a progress message with percentages and time estimate"""
         progress_str = self.get_progress_string()
         time_est = self.estimate_time_remaining()
-        print(f"{Colors.OKBLUE}{progress_str} {message} {Colors.OKCYAN}[ETA: {time_est}]{Colors.ENDC}")
-        logging.info(f"{progress_str} {message} [ETA: {time_est}]")
+        # Throttle console output; every progress message still goes to the log
+        now = time.monotonic()
+        if now - self._last_print >= PROGRESS_PRINT_INTERVAL:
+            self._last_print = now
+            print(f"{Colors.OKBLUE}{progress_str} {message} {Colors.OKCYAN}[ETA: {time_est}]{Colors.ENDC}")
+        self.logger.info("%s %s [ETA: %s]", progress_str, message, time_est)
 
 def generate_uuid():
-    return str(uuid.uuid4()).upper()
+    """Generate an uppercase UUID v4 in the canonical 8-4-4-4-12 form"""
+    h = uuid.uuid4().hex.upper()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+# Precompiled patterns for slugify
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+# ASCII fast path: keep word characters, turn whitespace/dashes into '-', drop the rest
+_SLUG_TABLE = str.maketrans({
+    c: ('-' if c.isspace() or c == '-' else None)
+    for c in map(chr, range(128))
+    if not (c.isalnum() or c == '_')
+})
+_SLUG_DASHES_RE = re.compile(r'-{2,}')
 
 def slugify(text):
     """Convert text to URL-friendly slug"""
     text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
-    return text.strip('-')
+    if text.isascii():
+        return _SLUG_DASHES_RE.sub('-', text.translate(_SLUG_TABLE)).strip('-')
+    return _SLUG_DASH_RE.sub('-', _SLUG_STRIP_RE.sub('', text)).strip('-')
+
+def _write_bytes(path, data: bytes) -> None:
+    """Write data to path in a single write"""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def _fast_copy(src, dst) -> None:
+    """Copy file contents in kernel space with os.copy_file_range, falling back to shutil.copyfile"""
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                chunk = max(os.fstat(fsrc.fileno()).st_size, 1 << 20)
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), chunk):
+                    pass
+            return
+        except OSError:
+            # Not supported by the kernel or filesystem (e.g. ENOSYS, EXDEV on older kernels)
+            pass
+    shutil.copyfile(src, dst)
+
+def dump_json(obj, pretty: bool = False) -> bytes:
+    """Serialize obj as compact (or, with pretty, indented) UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(obj)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _has_text(tag: Tag) -> bool:
+    """Return True if the tag contains any non-whitespace text (stops at the first string found)"""
+    return next(tag.stripped_strings, None) is not None
+
+@lru_cache(maxsize=1024)
+def _basename(path: str) -> str:
+    """Memoized os.path.basename for image srcs that are referenced repeatedly"""
+    return os.path.basename(path)
 
 class HTMLConverter:
-    def __init__(self, input_file: Path, output_dir: Path, logger: ProgressLogger):
+    def __init__(self, input_file: Path, output_dir: Path, logger: ProgressLogger, pretty_json: bool = False):
         self.input_file = input_file
         self.input_dir = input_file.parent
         self.output_dir = output_dir
         self.images_dir = output_dir / "images"
         self.articles_dir = output_dir / "articles"
         self.logger = logger
+        # Indent the output JSON for human inspection; the uploader doesn't need it
+        self.pretty_json = pretty_json
+        self.copied_images = set()  # Image filenames already copied to images_dir
+        # Plain string forms of the image directories for the per-image copy loop
+        self._input_dir_str = os.fspath(self.input_dir)
+        self._images_dir_str = os.fspath(self.images_dir)
         
     def setup_directories(self):
         if self.output_dir.exists():
@@ -196,7 +302,19 @@ class HTMLConverter:
         self.images_dir.mkdir(exist_ok=True)
         self.articles_dir.mkdir(exist_ok=True)
 
-    def parse_structure(self, soup: BeautifulSoup) -> Dict:
+    def iter_block_tags(self, html_path: Path) -> Iterator[Tag]:
+        """
+        Yield the top-level block elements of the document body in document order.
+        The document is parsed once, by lxml when it is installed, and the blocks are
+        yielded straight from that tree.
+        """
+        # Google Docs export puts everything in a flat list of p, h1, h2, etc. directly under body
+        with open(html_path, 'rb') as html_file:
+            soup = BeautifulSoup(html_file, HTML_PARSER, from_encoding='utf-8')
+        container = soup.body if soup.body else soup
+        yield from container.find_all(BLOCK_TAGS, recursive=False)
+
+    def parse_structure(self, blocks: Iterable[Tag]) -> Dict:
         """
         Parses HTML to build Manual > Chapter > Article > Step hierarchy.
         Assumes Google Docs HTML export structure:
@@ -235,156 +353,241 @@ class HTMLConverter:
             return {
                 "id": generate_uuid(),
                 "title": title,
-                "content": "",
+                "content": [],  # HTML fragments, joined once parsing is complete
                 "order": len(current_article["steps"]) + 1 if current_article else 1,
                 "images": []
             }
 
-        # Flatten the body to process tags sequentially
-        if soup.body:
-            elements = soup.body.find_all(recursive=False)
-        else:
-            elements = soup.find_all(recursive=False)
+        # --- Tag handlers ---
+        # Check for Google Docs specific classes/styles if needed, but tag name is primary signal
 
-        # Google Docs export puts everything in a flat list of p, h1, h2, etc.
-        # We need to iterate through them.
-        # Sometimes elements are wrapped in divs? Let's try finding all headings and content tags.
-        
-        # Better strategy for flat HTML: iterate over all direct children of body, or all tags if body missing
-        # Filter for relevant block tags
-        relevant_tags = ['h1', 'h2', 'h3', 'p', 'ul', 'ol', 'table', 'pre', 'blockquote', 'hr', 'div']
-        
-        # Use find_all on body if present
-        container = soup.body if soup.body else soup
-        
-        for tag in container.find_all(relevant_tags, recursive=False):
-            # Skip empty text nodes or irrelevant tags if any
-            if not isinstance(tag, Tag):
-                continue
-                
-            tag_name = tag.name
+        def on_h1(tag):
+            nonlocal current_chapter, current_article, current_step
+            # Headings only contribute their text; their HTML is never cleaned or kept
             text_content = tag.get_text(strip=True)
-            
-            # Clean HTML content for each tag
-            tag_html_content = self._clean_html(str(tag))
+            # H1 logic: First one is Manual Title if not set (or default), others are Chapters
+            if not manual["chapters"] and manual["title"] == "Converted Manual":
+                if text_content:
+                    manual["title"] = text_content
+                # Create default chapter to hold Intro content
+                current_chapter = new_chapter("Introduction")
+                manual["chapters"].append(current_chapter)
+            else:
+                current_chapter = new_chapter(text_content if text_content else "Untitled Chapter")
+                manual["chapters"].append(current_chapter)
+                current_article = None
+                current_step = None
 
-            # Check for Google Docs specific classes/styles if needed, but tag name is primary signal
-            
-            if tag_name == 'h1':
-                # H1 logic: First one is Manual Title if not set (or default), others are Chapters
-                if not manual["chapters"] and manual["title"] == "Converted Manual":
-                    if text_content:
-                        manual["title"] = text_content
-                    # Create default chapter to hold Intro content
-                    current_chapter = new_chapter("Introduction")
-                    manual["chapters"].append(current_chapter)
-                else:
-                    current_chapter = new_chapter(text_content if text_content else "Untitled Chapter")
-                    manual["chapters"].append(current_chapter)
-                    current_article = None
-                    current_step = None
+        def on_h2(tag):
+            nonlocal current_chapter, current_article, current_step
+            text_content = tag.get_text(strip=True)
+            if not current_chapter:
+                current_chapter = new_chapter("Introduction")
+                manual["chapters"].append(current_chapter)
             
-            elif tag_name == 'h2':
+            current_article = new_article(text_content if text_content else "Untitled Article")
+            current_chapter["articles"].append(current_article)
+            current_step = None
+
+        def on_h3(tag):
+            nonlocal current_chapter, current_article, current_step
+            text_content = tag.get_text(strip=True)
+            if not current_article:
                 if not current_chapter:
-                    current_chapter = new_chapter("Introduction")
+                    current_chapter = new_chapter("General")
                     manual["chapters"].append(current_chapter)
-                
-                current_article = new_article(text_content if text_content else "Untitled Article")
+                current_article = new_article("General Information")
                 current_chapter["articles"].append(current_article)
-                current_step = None
-                
-            elif tag_name == 'h3':
+            
+            current_step = new_step(text_content if text_content else "Untitled Step")
+            current_article["steps"].append(current_step)
+
+        def on_content(tag):
+            nonlocal current_chapter, current_article, current_step
+            # Content tags (p, ul, ol, table, etc.)
+            # Clean HTML content of the tag and collect its images
+            tag_html_content, tag_images = self._clean_tag(tag)
+
+            if not current_step:
+                # Content before any step? Attach to a default Intro step
                 if not current_article:
                     if not current_chapter:
-                        current_chapter = new_chapter("General")
+                        current_chapter = new_chapter("Introduction")
                         manual["chapters"].append(current_chapter)
-                    current_article = new_article("General Information")
+                    current_article = new_article("Overview")
                     current_chapter["articles"].append(current_article)
                 
-                current_step = new_step(text_content if text_content else "Untitled Step")
-                current_article["steps"].append(current_step)
-                
-            else:
-                # Content tags (p, ul, ol, table, etc.)
-                if not current_step:
-                    # Content before any step? Attach to a default Intro step
-                    if not current_article:
-                        if not current_chapter:
-                            current_chapter = new_chapter("Introduction")
-                            manual["chapters"].append(current_chapter)
-                        current_article = new_article("Overview")
-                        current_chapter["articles"].append(current_article)
+                if not current_article["steps"]:
+                    current_step = new_step("Introduction")
+                    current_article["steps"].append(current_step)
+                else:
+                    # Append to last step
+                    current_step = current_article["steps"][-1]
+
+            # Process Images within the tag
+            # Google Docs HTML uses local paths like "images/image1.png"
+            # We need to copy these to our output images directory
+            for img in tag_images:
+                src = img.get('src')
+                if src:
+                    # Clean src (sometimes url encoded)
+                    # src is likely relative like "images/image1.png"
+                    img_filename = _basename(src)
+                    
+                    # Record image for the step
+                    current_step["images"].append({
+                        "filename": img_filename,
+                        "src": src
+                    })
+                    
+                    # The same image may be referenced by several steps; copy it only once
+                    if img_filename in self.copied_images:
+                        continue
+                    
+                    # Copy image to global images dir (will be moved to article dir later)
+                    src_path = os.path.join(self._input_dir_str, src)
+                    dst_path = os.path.join(self._images_dir_str, img_filename)
                     
-                    if not current_article["steps"]:
-                        current_step = new_step("Introduction")
-                        current_article["steps"].append(current_step)
-                    else:
-                        # Append to last step
-                        current_step = current_article["steps"][-1]
-
-                # Process Images within the tag
-                # Google Docs HTML uses local paths like "images/image1.png"
-                # We need to copy these to our output images directory
-                for img in tag.find_all('img'):
-                    src = img.get('src')
-                    if src:
-                        # Clean src (sometimes url encoded)
-                        # src is likely relative like "images/image1.png"
-                        img_filename = os.path.basename(src)
-                        
-                        # Record image for the step
-                        current_step["images"].append({
-                            "filename": img_filename,
-                            "src": src
-                        })
-                        
-                        # Copy file if it exists
-                        src_path = self.input_dir / src
-                        dst_path = self.images_dir / img_filename
-                        
-                        if src_path.exists():
-                            # Copy image to global images dir (will be moved to article dir later)
-                            try:
-                                shutil.copy2(src_path, dst_path)
-                            except Exception as e:
-                                self.logger.warning(f"Failed to copy image {src}: {e}")
-                        else:
-                            self.logger.warning(f"Image not found: {src_path}")
-
-                # Append the HTML content of the tag to the step
-                # We convert the tag back to string
-                # NOTE: We might want to clean up Google Docs inline styles here
-                current_step["content"] += tag_html_content
+                    try:
+                        _fast_copy(src_path, dst_path)
+                        self.copied_images.add(img_filename)
+                    except FileNotFoundError:
+                        self.logger.warning(f"Image not found: {src_path}")
+                    except Exception as e:
+                        self.logger.warning(f"Failed to copy image {src}: {e}")
+
+            # Append the HTML content of the tag to the step
+            # We convert the tag back to string
+            # NOTE: We might want to clean up Google Docs inline styles here
+            current_step["content"].append(tag_html_content)
+
+        handlers = {'h1': on_h1, 'h2': on_h2, 'h3': on_h3}
+
+        # Process the body's block tags sequentially
+        for tag in blocks:
+            # Skip empty text nodes or irrelevant tags if any
+            if not isinstance(tag, Tag):
+                continue
 
-        return manual
+            handlers.get(tag.name, on_content)(tag)
 
-    def _clean_html(self, html: str) -> str:
-        """Clean and normalize HTML content from Google Docs with proper formatting preservation"""
-        if not html:
-            return ""
-        
-        # Use BeautifulSoup to parse and transform the HTML
-        soup = BeautifulSoup(html, 'html.parser')
+        # Join the collected HTML fragments of each step
+        for chapter in manual["chapters"]:
+            for article in chapter["articles"]:
+                for step in article["steps"]:
+                    step["content"] = "".join(step["content"])
 
-        # Remove empty spans that Google Docs often inserts
-        for span in soup.find_all('span'):
-            if not span.get_text(strip=True) and not span.find('img'):
-                span.decompose()
+        return manual
 
-        # Remove empty paragraphs
-        for p in soup.find_all('p'):
-            if not p.get_text(strip=True) and not p.find('img'):
-                p.decompose()
+    def _clean_tag(self, tag: Tag) -> Tuple[str, List[Tag]]:
+        """Clean and normalize a Google Docs block element in place.
 
-        # Unwrap unnecessary divs that Google Docs uses for styling
-        # Retain content inside, but remove the div itself
-        for div in soup.find_all('div'):
-            # Heuristic: if div only contains a single block element or text, unwrap it.
-            # This is a general approach, may need refinement for specific Google Docs structures.
-            if len(div.contents) == 1 and isinstance(div.contents[0], Tag) or div.get_text(strip=True):
-                div.unwrap()
+        Returns the cleaned HTML and the <img> tags it contains. The tag is modified
+        directly in the parsed document, so no serialize/re-parse round-trip is needed.
+        The block element itself is subject to the same rules as its descendants: an
+        empty paragraph yields "" and an unwrappable div yields its inner HTML.
+        """
+        # Collect the elements of interest in a single walk over the subtree
+        targets, images = [], []
+        for node in tag.descendants:
+            name = node.name  # Text nodes have no name
+            if name == 'img':
+                images.append(node)
+            elif name in _CLEANUP_TAGS:
+                targets.append(node)
 
-        return str(soup)
+        # Remove empty paragraphs
+        if tag.name == 'p' and not _has_text(tag) and not images:
+            return "", images
+
+        # Apply all cleanup rules in one pass. Walking in reverse document order handles
+        # every element after its descendants, which gives the same result as separate
+        # span, p and div passes: removing empty elements never changes an ancestor's
+        # text, and unwrapping a div with a single child tag keeps its parent's child count.
+        for node in reversed(targets):
+            name = node.name
+            if name == 'div':
+                # Unwrap unnecessary divs that Google Docs uses for styling
+                # Retain content inside, but remove the div itself
+                # Heuristic: if div only contains a single block element or text, unwrap it.
+                # This is a general approach, may need refinement for specific Google Docs structures.
+                if (len(node.contents) == 1 and isinstance(node.contents[0], Tag)) or _has_text(node):
+                    node.unwrap()
+            elif not _has_text(node) and not node.find('img'):
+                # Remove empty spans (Google Docs often inserts them) and empty paragraphs
+                node.decompose()
+
+        unwrap_self = tag.name == 'div' and (
+            (len(tag.contents) == 1 and isinstance(tag.contents[0], Tag)) or _has_text(tag))
+
+        # Images are never removed by the rules above, so all collected tags are still in place
+        return (tag.decode_contents() if unwrap_self else str(tag)), images
+
+    def write_output(self, manual_data: Dict) -> Tuple[int, int]:
+        """Write ScreenSteps formatted output and return article and image counts"""
+        now = datetime.now().isoformat()
+        manual = {
+            'manual': {
+                'id': manual_data['id'],
+                'title': manual_data['title'],
+                'created_at': now,
+                'updated_at': now,
+                'chapters': [
+                    {
+                        'id': chapter['id'],
+                        'title': chapter['title'],
+                        'order': chapter['order'],
+                        'description': '',
+                        'articles': chapter['articles']
+                    }
+                    for chapter in manual_data['chapters']
+                ]
+            }
+        }
+        
+        # Write table of contents
+        toc_file = self.output_dir / f"{manual_data['id']}.json"
+        _write_bytes(toc_file, dump_json(manual, self.pretty_json))
+        self.logger.substep(f"Created TOC: {toc_file.name}")
+        
+        # Collect the article files and sort images into per-article directories
+        article_count = 0
+        image_count = 0
+        article_files = []
+        image_copies = {}  # destination -> source
+        for chapter in manual_data['chapters']:
+            for article in chapter['articles']:
+                article_id = article['id']
+                article_files.append((self.articles_dir / f"{article_id}.json", article))
+                
+                article_images_dir = os.path.join(self._images_dir_str, article_id)
+                os.makedirs(article_images_dir, exist_ok=True)
+                for step in article['steps']:
+                    for img_info in step['images']:
+                        filename = img_info['filename']
+                        if filename not in self.copied_images:
+                            continue
+                        image_copies[os.path.join(article_images_dir, filename)] = \
+                            os.path.join(self._images_dir_str, filename)
+                        image_count += 1
+                
+                article_count += 1
+        
+        # Write the articles and copy the images concurrently
+        with ThreadPoolExecutor(max_workers=OUTPUT_WORKERS) as executor:
+            writes = executor.map(lambda pair: _write_bytes(pair[0], dump_json(pair[1], self.pretty_json)), article_files)
+            copies = executor.map(lambda item: _fast_copy(item[1], item[0]), image_copies.items())
+            list(writes)
+            list(copies)
+        
+        # Remove the flat copies now that every article has its own
+        for filename in self.copied_images:
+            os.remove(os.path.join(self._images_dir_str, filename))
+        
+        self.logger.substep(f"Created {article_count} article files with {image_count} images")
+        self.logger.success(f"Output written to: {self.output_dir}")
+        
+        return article_count, image_count
 
     def convert(self, cleanup: bool = True):
         self.setup_directories()
@@ -394,16 +597,14 @@ class HTMLConverter:
         self.logger.info(f"Output: {self.output_dir}")
         
         self.logger.step(1, 3, "Reading HTML file")
-        try:
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f, 'html.parser')
-        except Exception as e:
-            self.logger.error(f"Failed to read input file: {e}")
-            raise
-        self.logger.success(f"Successfully read {self.input_file.name}")
+        if not self.input_file.is_file():
+            self.logger.error(f"Failed to read input file: {self.input_file} not found")
+            raise FileNotFoundError(self.input_file)
+        self.logger.success(f"Found {self.input_file.name}")
 
+        # The whole file is parsed once; parse_structure then walks its top-level body blocks
         self.logger.step(2, 3, "Parsing structure and extracting content")
-        manual_data = self.parse_structure(soup)
+        manual_data = self.parse_structure(self.iter_block_tags(self.input_file))
         # Update logger totals based on parsed data (simple count for now)
         total_chapters = len(manual_data.get("chapters", []))
         total_articles = sum(len(ch.get("articles", [])) for ch in manual_data.get("chapters", []))
@@ -490,6 +691,8 @@ def main():
                        help='Enable verbose logging')
     parser.add_argument('--no-cleanup', action='store_true',
                        help='Keep temporary files after conversion (N/A for direct HTML conversion)')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Write indented JSON output (default: compact)')
     parser.add_argument('--version', action='version',
                        version=f'html_converter v{APP_VERSION}')
     parser.add_argument('--examples', action='store_true',
@@ -508,11 +711,10 @@ def main():
         return 0
     
     # --- Print Header ---
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'HTML to ScreenSteps Converter'.center(70)}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{f'Version: {APP_VERSION}'.center(70)}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.ENDC}\n")
+    print(f"{HEADER_BAR}\n{Colors.HEADER}{Colors.BOLD}{'HTML to ScreenSteps Converter'.center(70)}{Colors.ENDC}")
+    print(f"{Colors.HEADER}{Colors.BOLD}{f'Version: {APP_VERSION}'.center(70)}{Colors.ENDC}\n{HEADER_BAR}\n")
     
+    logger = None
     try:
         start_time = time.time()
         
@@ -533,7 +735,8 @@ def main():
             shutil.rmtree(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        converter_instance = HTMLConverter(input_path, output_dir, logger=ProgressLogger(verbose=args.verbose))
+        logger = ProgressLogger(verbose=args.verbose)
+        converter_instance = HTMLConverter(input_path, output_dir, logger=logger, pretty_json=args.pretty)
         converter_instance.convert(cleanup=not args.no_cleanup)
         
         elapsed = time.time() - start_time
@@ -549,6 +752,9 @@ def main():
         print(f"{Colors.FAIL}Error: {e}{Colors.ENDC}")
         logging.exception("Conversion failed")
         return 1
+    finally:
+        if logger is not None:
+            logger.close()
 
 if __name__ == "__main__":
     sys.exit(main())
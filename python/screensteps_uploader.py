@@ -10,19 +10,41 @@ Version: 1.0.3
 import sys
 import os
 import json
+import hashlib
+import gzip
 import argparse
 import logging
+import queue
 import time
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterator, List, Match, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 import uuid
 import re
 from bs4 import BeautifulSoup
 from PIL import Image
-from html import unescape
+from html import escape, unescape
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import html as lxml_html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
 
 # ANSI color codes for terminal output
 class Colors:
@@ -36,24 +58,208 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Separator lines for log output and headers
+SEPARATOR = "=" * 70
+HEADER_BAR = f"{Colors.HEADER}{Colors.BOLD}{SEPARATOR}{Colors.ENDC}"
+
+# Client-side request budgets (calls per window, in seconds); a 429 response
+# additionally stalls the affected limiter for the retry_in the server asks for
+API_CALLS_PER_WINDOW = 40
+API_CALL_WINDOW = 10.0
+# ScreenSteps rate limit for image uploads: 8 files per 10 seconds
+IMAGE_UPLOADS_PER_WINDOW = 8
+IMAGE_UPLOAD_WINDOW = 10.0
+IMAGE_UPLOAD_WORKERS = 8
+# Read buffer for streamed uploads; the HTTP layer asks for small blocks at a time
+UPLOAD_READ_BUFFER = 1 << 20
+
+# Articles created and filled concurrently; the API rate limiter still caps the request rate
+ARTICLE_WORKERS = 8
+
+# Site list cached between runs, since step 1 only checks that the site exists
+SITES_CACHE_DIR = Path.home() / ".cache" / "vlp2ss"
+SITES_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Progress of an unfinished upload, kept in the content directory so a re-run can continue it
+UPLOAD_STATE_FILE = ".vlp2ss-state.json"
+# Articles whose contents could not be saved, kept next to the state file for --resume
+FAILED_ARTICLES_FILE = ".vlp2ss-failed.json"
+
+# With --gzip, JSON request bodies larger than this are sent compressed (level 3 favours speed)
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 3
+# Status a server answers with when it cannot decode a compressed request body (Unsupported Media Type)
+GZIP_REJECTED_STATUS = 415
+
+# Connection pool size for the API session: one kept-alive connection per concurrent request
+HTTP_POOL_SIZE = ARTICLE_WORKERS + IMAGE_UPLOAD_WORKERS
+
+# Special blocks that split step HTML into separate ScreenSteps content blocks.
+# The image alternative captures its src so the match is not scanned a second time.
+CONTENT_BLOCK_RE = re.compile(
+    r'(<div class="html-embed">.*?</div>'
+    r'|<div class="screensteps-styled-block".*?>.*?</div>'
+    r'|<img[^>]+src="(?P<img_src>[^"]+)"[^>]*>)',
+    re.DOTALL
+)
+# Every special block starts with one of these; steps without them skip the regex scan
+CONTENT_BLOCK_MARKERS = ('<img', '<div class="')
+
+# Precompiled patterns used while generating content blocks
+TAG_RE = re.compile(r'<[^>]+>')
+STYLED_BLOCK_RE = re.compile(r'data-style="([^"]+)"[^>]*>(.*)</div>', re.DOTALL)
+YOUTUBE_ID_RE = re.compile(r'youtube\.com/embed/([^/?]+)')
+# Element selectors for in-place removal with lxml (match one token of the class list)
+STYLED_BLOCK_XPATH = ".//div[contains(concat(' ', normalize-space(@class), ' '), ' screensteps-styled-block ')]"
+YOUTUBE_EMBED_XPATH = ".//div[contains(concat(' ', normalize-space(@class), ' '), ' html-embed ')]"
+BLOCK_STYLE_CLASS_RE = re.compile(r'block-style-')
+BLOCK_STYLE_PREFIX = 'block-style-'
+BLOCK_STYLE_MAP = {
+    'block-style-introduction': 'introduction',
+    'block-style-tip': 'tip',
+    'block-style-info': 'info',
+    'block-style-alert': 'alert',
+    'block-style-warning': 'warning'
+}
+DIV_CLASS_RE = re.compile(
+    r'<div\b[^>]*?\sclass\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>"\']+))', re.IGNORECASE)
+HTML_PART_SPLIT_RE = re.compile(r'(<h[1-6][^>]*>.*?</h[1-6]>|<p[^>]*>.*?</p>)', re.DOTALL)
+HEADER_RE = re.compile(r'<h([1-6])[^>]*>(.*?)</h\1>', re.DOTALL)
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_DASH_RE = re.compile(r'[-\s]+')
+
 # Helper functions for content block generation
-def generate_uuid():
-    """Generate a UUID v4 for content blocks"""
-    return str(uuid.uuid4()).upper()
+def generate_uuid() -> str:
+    """Generate an uppercase UUID v4 in the canonical 8-4-4-4-12 form for content blocks"""
+    h = uuid.uuid4().hex.upper()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
-def slugify(text):
-    """Convert text to URL-friendly slug"""
+@lru_cache(maxsize=2048)
+def slugify(text: str) -> str:
+    """Convert text to URL-friendly slug (memoized; step titles repeat a lot)"""
     text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    text = SLUG_STRIP_RE.sub('', text)
+    text = SLUG_DASH_RE.sub('-', text)
     return text.strip('-')
 
-def extract_images_from_html(html_content):
+def file_digest(path: Path) -> str:
+    """Return a BLAKE2b content hash of a file"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+@lru_cache(maxsize=8192)
+def image_size(path: Path) -> Tuple[int, int]:
+    """Return (width, height) of an image from its header, or (800, 600) if unreadable (memoized per path)"""
+    try:
+        # Image.open only parses the header; pixel data is never decoded here
+        with Image.open(path) as img:
+            return img.size
+    except (OSError, ValueError):
+        return 800, 600
+
+def has_visible_text(html: str) -> bool:
+    """Return True if any non-whitespace text remains once <...> tags are removed"""
+    pos = 0
+    length = len(html)
+    while pos < length:
+        tag_start = html.find('<', pos)
+        text = html[pos:] if tag_start == -1 else html[pos:tag_start]
+        if text and not text.isspace():
+            return True
+        if tag_start == -1:
+            return False
+        tag_end = html.find('>', tag_start + 1)
+        if tag_end == -1 or tag_end == tag_start + 1:
+            # An unterminated or empty '<>' is not a tag, so the '<' itself is text
+            return True
+        pos = tag_end + 1
+    return False
+
+def iter_special_blocks(html_content: str) -> Iterator[Match[str]]:
+    """Return an iterator over the special-block matches in step HTML"""
+    if any(marker in html_content for marker in CONTENT_BLOCK_MARKERS):
+        return CONTENT_BLOCK_RE.finditer(html_content)
+    return iter(())
+
+def list_file_names(directory: Path) -> Set[str]:
+    """Return the names of the entries in a directory (empty if it does not exist)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def encode_json(obj) -> bytes:
+    """Serialize a request payload to compact UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, allow_nan=False).encode('utf-8')
+
+def load_json(path: Path):
+    """Read a JSON file, using orjson when installed"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_json_atomic(path: Path, obj):
+    """Write JSON to a temporary file and move it into place, so readers never see a partial file"""
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp_file.write_bytes(encode_json(obj))
+    os.replace(temp_file, path)
+
+def write_json_file(path: Path, obj):
+    """Write obj to path as indented UTF-8 JSON in a single write, using orjson when installed"""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def format_json(obj) -> str:
+    """Pretty-print JSON for log output"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+def parse_html_fragment(html_content: str) -> BeautifulSoup:
+    """Parse an HTML fragment with the fastest available parser"""
+    return BeautifulSoup(html_content, HTML_PARSER)
+
+def fragment_to_html(soup: BeautifulSoup) -> str:
+    """Serialize a parsed fragment without the <html>/<body> wrapper lxml adds"""
+    if soup.body is None:
+        return str(soup)
+    # lxml moves head-only elements such as <style> or <meta> into <head>
+    return ''.join(part.decode_contents() for part in (soup.head, soup.body) if part is not None)
+
+def remove_elements_from_html(html_content: str, xpath: str, tag: str,
+                              class_name: Optional[str] = None) -> str:
+    """Remove every element matching xpath (or tag/class_name without lxml) from an HTML fragment"""
+    if lxml_html is None:
+        soup = parse_html_fragment(html_content)
+        for element in soup.find_all(tag, class_=class_name):
+            element.decompose()
+        return fragment_to_html(soup)
+    
+    root = lxml_html.fragment_fromstring(html_content, create_parent='div')
+    for element in root.xpath(xpath):
+        # drop_tree() keeps the text following the element, unlike getparent().remove()
+        element.drop_tree()
+    return escape(root.text or '', quote=False) + ''.join(
+        lxml_html.tostring(child, encoding='unicode') for child in root)
+
+def extract_images_from_html(html_content: str) -> List[Dict]:
     """Extract image references from HTML"""
     if not html_content:
         return []
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_html_fragment(html_content)
     images = []
     
     for img in soup.find_all('img'):
@@ -69,22 +275,19 @@ def extract_images_from_html(html_content):
     
     return images
 
-def remove_images_from_html(html_content):
+def remove_images_from_html(html_content: str) -> str:
     """Remove img tags from HTML"""
     if not html_content:
         return ""
     
-    soup = BeautifulSoup(html_content, 'html.parser')
-    for img in soup.find_all('img'):
-        img.decompose()
-    return str(soup)
+    return remove_elements_from_html(html_content, './/img', 'img')
 
 def extract_styled_blocks_from_html(html_content: str) -> List[Dict]:
     """Extract ScreenSteps-styled HTML blocks and their content."""
-    if not html_content:
+    if not html_content or 'screensteps-styled-block' not in html_content:
         return []
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_html_fragment(html_content)
     styled_blocks = []
     
     # Find all divs with class 'screensteps-styled-block'
@@ -103,17 +306,14 @@ def remove_styled_blocks_from_html(html_content: str) -> str:
     if not html_content:
         return ""
     
-    soup = BeautifulSoup(html_content, 'html.parser')
-    for div in soup.find_all('div', class_='screensteps-styled-block'):
-        div.decompose()
-    return str(soup)
+    return remove_elements_from_html(html_content, STYLED_BLOCK_XPATH, 'div', 'screensteps-styled-block')
 
-def extract_youtube_embeds(html_content):
+def extract_youtube_embeds(html_content: str) -> List[Dict]:
     """Extract YouTube embed divs from HTML and return list of video IDs"""
-    if not html_content:
+    if not html_content or 'html-embed' not in html_content:
         return []
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_html_fragment(html_content)
     youtube_embeds = []
     
     # Find all YouTube embed divs
@@ -126,7 +326,7 @@ def extract_youtube_embeds(html_content):
             src = iframe.get('src', '')
             # Extract video ID from YouTube embed URL
             # Format: https://www.youtube.com/embed/VIDEO_ID
-            match = re.search(r'youtube\.com/embed/([^/?]+)', src)
+            match = YOUTUBE_ID_RE.search(src)
             if match:
                 video_id = match.group(1)
                 youtube_embeds.append({
@@ -136,47 +336,136 @@ def extract_youtube_embeds(html_content):
     
     return youtube_embeds
 
-def remove_youtube_embeds_from_html(html_content):
+def remove_youtube_embeds_from_html(html_content: str) -> str:
     """Remove YouTube embed divs from HTML"""
     if not html_content:
         return ""
     
-    soup = BeautifulSoup(html_content, 'html.parser')
     # Remove html-embed divs (YouTube embeds)
-    for div in soup.find_all('div', class_='html-embed'):
-        div.decompose()
-    return str(soup)
+    return remove_elements_from_html(html_content, YOUTUBE_EMBED_XPATH, 'div', 'html-embed')
 
-def detect_style_from_html(html_content):
+def detect_style_from_html(html_content: str) -> Optional[str]:
     """Detect ScreenSteps style from VLP HTML"""
-    if not html_content:
+    # Style classes all share this prefix, so most content is rejected without scanning
+    if not html_content or BLOCK_STYLE_PREFIX not in html_content:
         return None
     
-    style_map = {
-        'block-style-introduction': 'introduction',
-        'block-style-tip': 'tip',
-        'block-style-info': 'info',
-        'block-style-alert': 'alert',
-        'block-style-warning': 'warning'
-    }
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
-    for div in soup.find_all('div', class_=True):
-        for class_name in div.get('class', []):
-            if class_name in style_map:
-                return style_map[class_name]
+    # Class attributes of <div> tags in document order; no HTML parse needed
+    for match in DIV_CLASS_RE.finditer(html_content):
+        class_value = next(group for group in match.groups() if group is not None)
+        for class_name in class_value.split():
+            if class_name in BLOCK_STYLE_MAP:
+                return BLOCK_STYLE_MAP[class_name]
     
     return None
 
-def remove_style_divs(html_content):
+def remove_style_divs(html_content: str) -> str:
     """Remove block-style div wrappers but keep content"""
     if not html_content:
         return ""
     
-    soup = BeautifulSoup(html_content, 'html.parser')
-    for div in soup.find_all('div', class_=re.compile(r'block-style-')):
+    soup = parse_html_fragment(html_content)
+    for div in soup.find_all('div', class_=BLOCK_STYLE_CLASS_RE):
         div.unwrap()
-    return str(soup)
+    return fragment_to_html(soup)
+
+class RateLimiter:
+    """Thread-safe sliding window limiter: at most max_calls per period seconds"""
+    
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self.calls = deque()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+    
+    def penalize(self, seconds: float):
+        """Hold back all calls for the given number of seconds"""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+    
+    def acquire(self):
+        """Block until another call is allowed and record it"""
+        with self.lock:
+            now = time.monotonic()
+            if self.blocked_until > now:
+                time.sleep(self.blocked_until - now)
+                now = time.monotonic()
+            if len(self.calls) >= self.max_calls:
+                wait = self.calls[0] + self.period - now
+                if wait > 0:
+                    time.sleep(wait)
+                    now = time.monotonic()
+                self.calls.popleft()
+            self.calls.append(now)
+
+class MultipartFileBody:
+    """multipart/form-data request body that streams a file from disk
+
+    requests sends any object with read() and a len attribute as a streamed body,
+    so the file is never held in memory as a whole; seek() allows resending on retry.
+    """
+    
+    def __init__(self, fields: Dict[str, str], file_field: str, file_path: Path, file_type: str):
+        boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+        parts = [
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            for name, value in fields.items()
+        ]
+        filename = file_path.name.replace('"', '%22')
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f'Content-Type: {file_type}\r\n\r\n'
+        )
+        self.head = ''.join(parts).encode('utf-8')
+        self.tail = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+        self.file = open(file_path, 'rb', buffering=UPLOAD_READ_BUFFER)
+        self.file_size = os.fstat(self.file.fileno()).st_size
+        self.len = len(self.head) + self.file_size + len(self.tail)
+        self.pos = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes of the encoded body"""
+        if size is None or size < 0:
+            size = self.len - self.pos
+        file_start = len(self.head)
+        file_end = file_start + self.file_size
+        chunks = []
+        while size > 0 and self.pos < self.len:
+            if self.pos < file_start:
+                chunk = self.head[self.pos:self.pos + size]
+            elif self.pos < file_end:
+                chunk = self.file.read(min(size, file_end - self.pos))
+                if not chunk:
+                    raise IOError(f"{self.file.name} changed size during upload")
+            else:
+                chunk = self.tail[self.pos - file_end:self.pos - file_end + size]
+            chunks.append(chunk)
+            self.pos += len(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+    
+    def tell(self) -> int:
+        return self.pos
+    
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self.pos, os.SEEK_END: self.len}[whence]
+        self.pos = min(max(base + offset, 0), self.len)
+        self.file.seek(min(max(self.pos - len(self.head), 0), self.file_size))
+        return self.pos
+    
+    def close(self):
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __repr__(self):
+        return f"<multipart body: {self.file.name}, {self.len} bytes>"
 
 class ScreenStepsAPI:
     """ScreenSteps API client"""
@@ -190,75 +479,147 @@ class ScreenStepsAPI:
         self.auth = HTTPBasicAuth(user, token)
         self.session = requests.Session()
         self.session.auth = self.auth
+        # Keep enough persistent connections to the API host for concurrent uploads,
+        # and let urllib3 retry transient errors with backoff (429 is handled in _request).
+        # POST creates manuals, chapters, articles and files and is not idempotent: a 5xx
+        # or read timeout may come after the server committed, so only GET is retried on
+        # those. Connection errors are retried for every method, since nothing was sent.
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=5,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(['GET']),
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        # Requests only wait when the budget is used up, instead of after every call
+        self.api_rate_limiter = RateLimiter(API_CALLS_PER_WINDOW, API_CALL_WINDOW)
+        # Image uploads run concurrently, throttled to the ScreenSteps file upload quota
+        self.image_rate_limiter = RateLimiter(IMAGE_UPLOADS_PER_WINDOW, IMAGE_UPLOAD_WINDOW)
+        self.upload_executor = ThreadPoolExecutor(max_workers=IMAGE_UPLOAD_WORKERS)
+        # Uploaded image files keyed by "<account>/<site_id>/<content hash>", so identical
+        # images (repeated in the content or from an earlier run) are only uploaded once
+        self.image_map = {}
+        self.image_uploads = {}  # Same keys -> upload futures of the current run
+        self.image_digests = {}  # (path, size, mtime) -> content hash, so files are hashed once
+        self.image_uploads_lock = threading.Lock()  # Articles are processed from several threads
+        self.stale_image_ids = set()  # Asset IDs dropped from image_map after the server lost them
+        self.gzip_requests = False  # Set by --gzip; turned off if the server rejects gzip bodies
     
-    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """Make API request with rate limiting and retry logic"""
+    def close(self):
+        """Wait for pending image uploads and close the pooled connections"""
+        self.upload_executor.shutdown(wait=True)
+        self.session.close()
+    
+    def _request(self, method: str, endpoint: str, limiter: Optional[RateLimiter] = None,
+                 compress: bool = False, **kwargs) -> requests.Response:
+        """Make API request with rate limiting and retry logic
+
+        limiter is an extra endpoint-specific budget (e.g. file uploads) applied on top
+        of the general API budget; a 429 response stalls it, or the API budget if omitted.
+        compress gzips a large JSON body while gzip_requests is set; it is resent uncompressed,
+        and compression is turned off, if the server answers 415.
+        """
         url = f"{self.base_url}/{endpoint}"
+        limiters = (self.api_rate_limiter,) if limiter is None else (limiter, self.api_rate_limiter)
+        
+        # Request/response details (including JSON pretty-printing) are only built in verbose mode
+        verbose = getattr(self, 'verbose', False)
+        
+        # Encode JSON payloads ourselves (orjson when available) instead of requests' json=
+        payload = kwargs.pop('json', None)
+        compressed = None  # (plain body, headers) while a gzip body is being sent
+        if payload is not None:
+            kwargs['data'] = encode_json(payload)
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'Content-Type': 'application/json'}
+            if compress and self.gzip_requests and len(kwargs['data']) > GZIP_MIN_SIZE:
+                compressed = (kwargs['data'], kwargs['headers'])
+                kwargs['data'] = gzip.compress(kwargs['data'], compresslevel=GZIP_LEVEL)
+                kwargs['headers'] = {**kwargs['headers'], 'Content-Encoding': 'gzip'}
         
         # Log request details in verbose mode
-        if hasattr(self, 'verbose') and self.verbose:
-            self.logger.info("=" * 70)
+        if verbose:
+            self.logger.info(SEPARATOR)
             self.logger.info("API REQUEST DETAILS:")
             self.logger.info(f"  Endpoint: {method} {url}")
             self.logger.info(f"  Username: {self.user}")
-            if 'json' in kwargs:
-                self.logger.info(f"  JSON Data: {json.dumps(kwargs['json'], indent=2)}")
-            if 'data' in kwargs:
+            if payload is not None:
+                self.logger.info(f"  JSON Data: {format_json(payload)}")
+            elif 'data' in kwargs:
                 self.logger.info(f"  Form Data: {kwargs['data']}")
             if 'files' in kwargs:
                 self.logger.info(f"  Files: {list(kwargs['files'].keys())}")
-            self.logger.info("=" * 70)
+            self.logger.info(SEPARATOR)
         
         while True:
+            for budget in limiters:
+                budget.acquire()
+            # A streamed body has to be rewound before it can be sent again
+            body = kwargs.get('data')
+            if hasattr(body, 'seek'):
+                body.seek(0)
             try:
                 response = self.session.request(method, url, **kwargs)
                 
                 # Log response details in verbose mode
-                if hasattr(self, 'verbose') and self.verbose:
+                if verbose:
                     self.logger.info("API RESPONSE:")
                     self.logger.info(f"  Status Code: {response.status_code}")
                     self.logger.info(f"  Headers: {dict(response.headers)}")
-                    try:
-                        self.logger.info(f"  Body: {response.json()}")
-                    except:
+                    # Log the body as received; callers parse the JSON once themselves
+                    if 'json' in response.headers.get('Content-Type', ''):
+                        self.logger.info(f"  Body: {response.text}")
+                    else:
                         self.logger.info(f"  Body: {response.text[:500]}")
-                    self.logger.info("=" * 70)
+                    self.logger.info(SEPARATOR)
                 
                 if response.status_code == 200 or response.status_code == 201:
-                    # Add delay between successful API calls to avoid rate limiting
-                    time.sleep(0.25)
                     return response
                 elif response.status_code == 429:
-                    # Rate limit exceeded - check for retry_in value
+                    # Rate limit exceeded - check for retry_in value and stall the
+                    # exhausted budget; the retry waits for it in acquire()
                     try:
                         retry_info = response.json()
                         retry_in = retry_info.get('retry_in', 60)
                         self.logger.warning(f"Rate limit exceeded. Retrying in {retry_in} seconds...")
-                        time.sleep(retry_in)                    
                     except ValueError:
+                        retry_in = 60
                         self.logger.warning("Rate limit exceeded. Retrying in 60 seconds...")
-                        time.sleep(60)
+                    limiters[0].penalize(retry_in)
+                elif compressed is not None and response.status_code == GZIP_REJECTED_STATUS:
+                    # The server cannot read gzip bodies: resend uncompressed and stop compressing
+                    if self.gzip_requests:
+                        self.logger.warning("Server does not accept gzip request bodies; sending them uncompressed")
+                        self.gzip_requests = False
+                    kwargs['data'], kwargs['headers'] = compressed
+                    compressed = None
+                    continue
                 else:
-                    self.logger.error("=" * 70)
+                    self.logger.error(SEPARATOR)
                     self.logger.error("API REQUEST FAILED:")
                     self.logger.error(f"  Endpoint: {method} {url}")
                     self.logger.error(f"  Username: {self.user}")
                     self.logger.error(f"  Status Code: {response.status_code}")
-                    if 'json' in kwargs:
-                        self.logger.error(f"  Request JSON: {json.dumps(kwargs['json'], indent=2)}")
+                    if payload is not None:
+                        self.logger.error(f"  Request JSON: {format_json(payload)}")
                     self.logger.error(f"  Response: {response.text}")
-                    self.logger.error("=" * 70)
+                    self.logger.error(SEPARATOR)
                     response.raise_for_status()
                     
             except requests.exceptions.RequestException as e:
-                self.logger.error("=" * 70)
+                self.logger.error(SEPARATOR)
                 self.logger.error("REQUEST EXCEPTION:")
                 self.logger.error(f"  Endpoint: {method} {url}")
                 self.logger.error(f"  Username: {self.user}")
-                if 'json' in kwargs:
-                    self.logger.error(f"  Request JSON: {json.dumps(kwargs['json'], indent=2)}")
+                if payload is not None:
+                    self.logger.error(f"  Request JSON: {format_json(payload)}")
                 self.logger.error(f"  Error: {e}")
-                self.logger.error("=" * 70)
+                self.logger.error(SEPARATOR)
                 raise
     
     def get_sites(self) -> List[Dict]:
@@ -303,6 +664,16 @@ class ScreenStepsAPI:
                                 json=data)
         return response.json().get('chapter', {})
     
+    def create_chapters(self, site_id: str, manual_id: str, chapters: List[Dict]) -> List[Dict]:
+        """Create several chapters of an existing manual concurrently, returned in input order"""
+        # The API has no bulk endpoint for chapters of an existing manual; chapters carry
+        # explicit positions, so their requests can overlap instead of running one by one
+        with ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as executor:
+            return list(executor.map(
+                lambda chapter: self.create_chapter(site_id, manual_id, **chapter),
+                chapters
+            ))
+    
     def create_article(self, site_id: str, chapter_id: str, title: str, 
                       position: int) -> Dict:
         """Create a new article (placeholder - content added separately)"""
@@ -330,22 +701,58 @@ class ScreenStepsAPI:
              -F "type=ImageAsset" \
              -F "file=@image.png"
         """
-        with open(image_path, 'rb') as f:
-            # Prepare multipart form data (equivalent to curl -F flags)
-            files = {
-                'type': (None, 'ImageAsset'),  # -F "type=ImageAsset"
-                'file': (image_path.name, f, 'image/png')  # -F "file=@image.png"
-            }
-            
+        # Prepare multipart form data (equivalent to curl -F flags), streamed from disk:
+        # -F "type=ImageAsset" -F "file=@image.png"
+        with MultipartFileBody({'type': 'ImageAsset'}, 'file', image_path, 'image/png') as body:
             # Use the _request method which handles rate limiting
-            response = self._request('POST', f'sites/{site_id}/files', 
-                                   files=files)
-            
-            # Add delay after successful upload
             # ScreenSteps rate limit: 8 files per 10 seconds for image uploads
-            time.sleep(1.25)
+            response = self._request('POST', f'sites/{site_id}/files', 
+                                   limiter=self.image_rate_limiter, data=body,
+                                   headers={'Content-Type': body.content_type})
             return response.json()
     
+    def _upload_and_record(self, key: str, site_id: str, article_id: str, image_path: Path) -> Dict:
+        """Upload an image and remember the resulting file for identical content"""
+        image_response = self.upload_image(site_id, article_id, image_path)
+        if image_response and 'file' in image_response and 'id' in image_response['file']:
+            # forget_images walks the map from an article thread
+            with self.image_uploads_lock:
+                self.image_map[key] = image_response['file']
+        return image_response
+    
+    def upload_image_once(self, site_id: str, article_id: str, image_path: Path) -> Future:
+        """Start uploading an image unless identical content was already uploaded to the site"""
+        # Repeated references to an unchanged file reuse its hash without reading it again
+        stat = os.stat(image_path)
+        signature = (str(image_path), stat.st_size, stat.st_mtime_ns)
+        digest = self.image_digests.get(signature)
+        if digest is None:
+            digest = self.image_digests[signature] = file_digest(image_path)
+        key = f"{self.account}/{site_id}/{digest}"
+        with self.image_uploads_lock:
+            future = self.image_uploads.get(key)
+            if future is not None and not (future.done() and future.exception() is not None):
+                return future
+            
+            if key in self.image_map:
+                future = Future()
+                future.set_result({'file': self.image_map[key]})
+            else:
+                future = self.upload_executor.submit(self._upload_and_record, key, site_id, article_id, image_path)
+            self.image_uploads[key] = future
+            return future
+    
+    def forget_images(self, asset_ids: Set) -> bool:
+        """Drop recorded uploads of the given asset IDs so they are uploaded again
+
+        Returns whether any of the IDs was a recorded upload (now or by another article).
+        """
+        with self.image_uploads_lock:
+            for key in [key for key, file in self.image_map.items() if file.get('id') in asset_ids]:
+                self.stale_image_ids.add(self.image_map.pop(key)['id'])
+                self.image_uploads.pop(key, None)
+            return not self.stale_image_ids.isdisjoint(asset_ids)
+    
     def update_article_contents(self, site_id: str, article_id: str, 
                                title: str, content_blocks: List[Dict], 
                                publish: bool = True) -> Dict:
@@ -358,25 +765,47 @@ class ScreenStepsAPI:
             }
         }
         response = self._request('POST', f'sites/{site_id}/articles/{article_id}/contents', 
-                                json=data)
+                                compress=True, json=data)
         return response.json().get('article', {})
     
     def generate_content_blocks(self, article_data: Dict, images_dir: Path, 
                                site_id: str, article_id: str, article_vlp_id: str,
-                               chapter_title: str = "Unknown", skipped_images: list = None,
-                               uploaded_images_count: list = None) -> List[Dict]:
+                               chapter_title: str = "Unknown", skipped_images: Optional[List[Dict]] = None,
+                               uploaded_images_count: Optional[List[int]] = None) -> List[Dict]:
         """Generate ScreenSteps content_blocks from VLP article data"""
         if skipped_images is None:
             skipped_images = []
         if uploaded_images_count is None:
             uploaded_images_count = [0]
         
-        content_blocks = []
+        content_blocks: List[Dict] = []
+        add_block = content_blocks.append
         sort_order = 1
         
         # Images are stored in article-specific subdirectories
         article_images_dir = images_dir / article_vlp_id
         
+        # Start all image uploads of the article up front so they run concurrently;
+        # results are consumed below in document order as the blocks are assembled
+        pending_images: Deque[Tuple[str, Path, Optional[Future]]] = deque()
+        available_images: Optional[Set[str]] = None  # Listed once, on the first image reference
+        for step in article_data.get('steps', []):
+            for match in iter_special_blocks(step.get('content', '')):
+                img_src = match.group('img_src')
+                if img_src is None:
+                    continue
+                src = unescape(img_src)
+                filename = src.split('/')[-1].split('?')[0]
+                image_path = article_images_dir / filename
+                if available_images is None:
+                    available_images = list_file_names(article_images_dir)
+                future = None
+                # Only names missing from the listing need a stat (e.g. case-insensitive file systems);
+                # a missing or empty image directory rules out every image without touching the disk
+                if filename in available_images or (available_images and image_path.exists()):
+                    future = self.upload_image_once(site_id, article_id, image_path)
+                pending_images.append((filename, image_path, future))
+        
         for step in article_data.get('steps', []):
             # Create StepContent block
             step_uuid = generate_uuid()
@@ -391,83 +820,85 @@ class ScreenStepsAPI:
                 'auto_numbered': False,
                 'foldable': False
             }
-            content_blocks.append(step_block)
+            add_block(step_block)
+            add_child_id = step_block['content_block_ids'].append
             sort_order += 1
 
-            # New sequential parsing logic to preserve content order
+            # Sequential single-scan parsing to preserve content order
             html_content = step.get('content', '')
             
-            block_regex = re.compile(r'(<div class="html-embed">.*?</div>|<div class="screensteps-styled-block".*?>.*?</div>|<img[^>]+src="[^"]+"[^>]*>)', re.DOTALL)
-            
             last_index = 0
             
-            for match in block_regex.finditer(html_content):
+            for match in iter_special_blocks(html_content):
                 start, end = match.span()
                 
                 # 1. Process text before the special block
                 text_before = html_content[last_index:start]
-                plain_text_before = re.sub(r'<[^>]+>', '', text_before).strip()
-                if plain_text_before:
+                if has_visible_text(text_before):
                     text_uuid = generate_uuid()
                     text_block = {
                         'uuid': text_uuid, 'type': 'TextContent', 'body': text_before, 'depth': 1, 
                         'sort_order': sort_order, 'style': None, 'show_copy_clipboard': False
                     }
-                    content_blocks.append(text_block)
-                    step_block['content_block_ids'].append(text_uuid)
+                    add_block(text_block)
+                    add_child_id(text_uuid)
                     sort_order += 1
                 
                 # 2. Process the special block itself
                 block_html = match.group(0)
                 
-                if block_html.startswith('<img'):
-                    img_match = re.search(r'<img[^>]+src="([^"]+)"', block_html)
-                    if img_match:
-                        src = unescape(img_match.group(1))
-                        filename = src.split('/')[-1].split('?')[0]
-                        image_path = article_images_dir / filename
-                        
-                        image_processed = False
-                        if image_path.exists():
-                            try:
-                                image_response = self.upload_image(site_id, article_id, image_path)
-                                if image_response and 'file' in image_response and 'id' in image_response['file']:
-                                    # ... (code to create image_block) ...
-                                    image_asset_id = image_response['file']['id']
-                                    image_uuid = generate_uuid()
-                                    image_block = {
-                                        'uuid': image_uuid, 'type': 'ImageContentBlock', 'asset_file_name': filename,
-                                        'image_asset_id': image_asset_id, 'width': image_response['file'].get('width', 800),
-                                        'height': image_response['file'].get('height', 600), 'depth': 1, 'sort_order': sort_order,
-                                        'alt_tag': "", 'url': image_response['file'].get('url', '')
-                                    }
-                                    content_blocks.append(image_block)
-                                    step_block['content_block_ids'].append(image_uuid)
-                                    sort_order += 1
-                                    uploaded_images_count[0] += 1
-                                    image_processed = True
-                                else:
-                                    self.logger.warning(f"Invalid API response for image {filename}")
-                            except Exception as e:
-                                self.logger.warning(f"Failed to upload image {filename}: {e}")
-                        else:
-                             self.logger.warning(f"Image not found, skipping: {image_path}")
+                img_src = match.group('img_src')
+                if img_src is not None:
+                    filename, image_path, future = pending_images.popleft()
+                    
+                    image_processed = False
+                    if future is not None:
+                        try:
+                            image_response = future.result()
+                            if image_response and 'file' in image_response and 'id' in image_response['file']:
+                                # ... (code to create image_block) ...
+                                image_file = image_response['file']
+                                image_asset_id = image_file['id']
+                                # Prefer the dimensions reported by the API, else read them locally
+                                width, height = image_file.get('width'), image_file.get('height')
+                                if width is None or height is None:
+                                    local_width, local_height = image_size(image_path)
+                                    width = local_width if width is None else width
+                                    height = local_height if height is None else height
+                                image_uuid = generate_uuid()
+                                image_block = {
+                                    'uuid': image_uuid, 'type': 'ImageContentBlock', 'asset_file_name': filename,
+                                    'image_asset_id': image_asset_id, 'width': width,
+                                    'height': height, 'depth': 1, 'sort_order': sort_order,
+                                    'alt_tag': "", 'url': image_file.get('url', '')
+                                }
+                                add_block(image_block)
+                                add_child_id(image_uuid)
+                                sort_order += 1
+                                uploaded_images_count[0] += 1
+                                image_processed = True
+                            else:
+                                self.logger.warning(f"Invalid API response for image {filename}")
+                        except Exception as e:
+                            self.logger.warning(f"Failed to upload image {filename}: {e}")
+                    else:
+                         self.logger.warning(f"Image not found, skipping: {image_path}")
 
-                        if not image_processed:
-                            # Add placeholder alert block if image failed to process
-                            skipped_images.append({
-                                'image_path': str(image_path), 'chapter_title': chapter_title, 
-                                'article_title': article_data.get('title', 'Unknown'), 'step_title': step.get('title', 'Unknown')
-                            })
-                            placeholder_uuid = generate_uuid()
-                            placeholder_block = {
-                                'uuid': placeholder_uuid, 'type': 'TextContent', 'body': '<p>ERROR IMPORTING IMAGE - PLEASE RE-CREATE SCREENSHOT</p>',
-                                'style': 'alert', 'depth': 1, 'sort_order': sort_order, 'anchor_name': '', 
-                                'auto_numbered': False, 'foldable': False
-                            }
-                            content_blocks.append(placeholder_block)
-                            step_block['content_block_ids'].append(placeholder_uuid)
-                            sort_order += 1
+                    if not image_processed:
+                        # Add placeholder alert block if image failed to process
+                        skipped_images.append({
+                            'image_path': str(image_path), 'chapter_title': chapter_title, 
+                            'article_title': article_data.get('title', 'Unknown'), 'step_title': step.get('title', 'Unknown')
+                        })
+                        placeholder_uuid = generate_uuid()
+                        placeholder_block = {
+                            'uuid': placeholder_uuid, 'type': 'TextContent', 'body': '<p>ERROR IMPORTING IMAGE - PLEASE RE-CREATE SCREENSHOT</p>',
+                            'style': 'alert', 'depth': 1, 'sort_order': sort_order, 'anchor_name': '', 
+                            'auto_numbered': False, 'foldable': False
+                        }
+                        add_block(placeholder_block)
+                        add_child_id(placeholder_uuid)
+                        sort_order += 1
 
                 elif block_html.startswith('<div class="html-embed"'):
                     embed_uuid = generate_uuid()
@@ -475,12 +906,12 @@ class ScreenStepsAPI:
                         'uuid': embed_uuid, 'type': 'TextContent', 'body': block_html, 'depth': 1,
                         'sort_order': sort_order, 'style': 'html-embed', 'show_copy_clipboard': False
                     }
-                    content_blocks.append(embed_block)
-                    step_block['content_block_ids'].append(embed_uuid)
+                    add_block(embed_block)
+                    add_child_id(embed_uuid)
                     sort_order += 1
                     
                 elif block_html.startswith('<div class="screensteps-styled-block"'):
-                    style_match = re.search(r'data-style="([^"]+)"[^>]*>(.*)</div>', block_html, re.DOTALL)
+                    style_match = STYLED_BLOCK_RE.search(block_html)
                     if style_match:
                         style = style_match.group(1)
                         inner_body = style_match.group(2)
@@ -489,23 +920,22 @@ class ScreenStepsAPI:
                             'uuid': block_uuid, 'type': 'TextContent', 'body': inner_body, 'depth': 1,
                             'sort_order': sort_order, 'style': style, 'show_copy_clipboard': False
                         }
-                        content_blocks.append(block)
-                        step_block['content_block_ids'].append(block_uuid)
+                        add_block(block)
+                        add_child_id(block_uuid)
                         sort_order += 1
 
                 last_index = end
 
             # 3. Process any remaining text after the last special block
             remaining_text = html_content[last_index:]
-            plain_remaining_text = re.sub(r'<[^>]+>', '', remaining_text).strip()
-            if plain_remaining_text:
+            if has_visible_text(remaining_text):
                 text_uuid = generate_uuid()
                 text_block = {
                     'uuid': text_uuid, 'type': 'TextContent', 'body': remaining_text, 'depth': 1,
                     'sort_order': sort_order, 'style': None, 'show_copy_clipboard': False
                 }
-                content_blocks.append(text_block)
-                step_block['content_block_ids'].append(text_uuid)
+                add_block(text_block)
+                add_child_id(text_uuid)
                 sort_order += 1
         
         return content_blocks
@@ -513,13 +943,19 @@ class ScreenStepsAPI:
 class ScreenStepsUploader:
     """Upload converted content to ScreenSteps"""
     
-    def __init__(self, account: str, user: str, token: str, verbose: bool = False, suffix: bool = False):
+    def __init__(self, account: str, user: str, token: str, verbose: bool = False, suffix: bool = False,
+                 gzip_requests: bool = False):
         self.verbose = verbose
         self.setup_logging(verbose)
         self.logger = logging.getLogger(__name__)
         self.api = ScreenStepsAPI(account, user, token, self)
         self.api.verbose = verbose  # Pass verbose flag to API client
-        self.image_map = {}  # Map old image paths to new URLs
+        self.api.gzip_requests = gzip_requests
+        # Uploaded images by content hash, kept across runs to avoid re-uploading; stored
+        # with the site cache because the converters clear logs/ on every run
+        self.image_map_file = SITES_CACHE_DIR / f"{account}-images.json"
+        self.image_map = self.api.image_map
+        self.load_image_map()
         # Progress tracking
         self.start_time = time.time()
         self.total_manuals = 0
@@ -556,25 +992,89 @@ class ScreenStepsUploader:
         console_formatter = logging.Formatter('%(message)s')
         console_handler.setFormatter(console_formatter)
         
+        # File writes happen on a background thread; logging calls, including those from
+        # the upload worker threads, only enqueue the record
+        log_queue = queue.SimpleQueue()
+        self._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._listener.start()
+        
         # Configure logger
         logger = logging.getLogger()
         logger.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
+        logger.addHandler(QueueHandler(log_queue))
         logger.addHandler(console_handler)
         
         self.log_file = log_file
     
+    def close(self):
+        """Flush pending records to the log file, stop the background writer and close the file"""
+        if self._listener is not None:
+            self._listener.stop()
+            # stop() only drains the queue; the file handler it wrote to is still open
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+    
+    def load_image_map(self):
+        """Load uploaded image records from a previous run"""
+        try:
+            self.image_map.update(load_json(self.image_map_file))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable image map %s: %s", self.image_map_file, e)
+    
+    def save_image_map(self):
+        """Persist uploaded image records for later runs"""
+        try:
+            self.image_map_file.parent.mkdir(parents=True, exist_ok=True)
+            with self.api.image_uploads_lock:
+                image_map = dict(self.image_map)
+            write_json_file(self.image_map_file, image_map)
+        except OSError as e:
+            self.logger.warning("Could not save image map %s: %s", self.image_map_file, e)
+    
+    def load_upload_state(self, state_file: Path, site_id: str) -> Dict:
+        """Load the progress of an interrupted upload of the same content to the same site"""
+        try:
+            state = load_json(state_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable upload state %s: %s", state_file, e)
+            return {}
+        if state.get('site_id') != str(site_id) or not state.get('manual_id'):
+            return {}
+        return state
+    
+    def load_failed_articles(self, content_dir: Path) -> List[Dict]:
+        """Load the articles recorded as failed by an earlier upload of the content"""
+        failed_articles_file = content_dir / FAILED_ARTICLES_FILE
+        try:
+            return load_json(failed_articles_file)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable failed article record %s: %s", failed_articles_file, e)
+            return []
+    
+    def save_failed_articles(self, content_dir: Path, failed_articles: List[Dict]):
+        """Record articles whose contents failed to upload, or clear the record if none did"""
+        failed_articles_file = content_dir / FAILED_ARTICLES_FILE
+        if failed_articles:
+            write_json_atomic(failed_articles_file, failed_articles)
+        elif failed_articles_file.exists():
+            failed_articles_file.unlink()
+    
     def header(self, message: str):
         """Print header"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{message.center(70)}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}\n")
-        self.logger.info(f"HEADER: {message}")
+        print(f"\n{HEADER_BAR}\n{Colors.HEADER}{Colors.BOLD}{message.center(70)}{Colors.ENDC}\n{HEADER_BAR}\n")
+        self.logger.info("HEADER: %s", message)
     
     def success(self, message: str):
         """Print success"""
         print(f"{Colors.OKGREEN}✓ {message}{Colors.ENDC}")
-        self.logger.info(f"SUCCESS: {message}")
+        self.logger.info("SUCCESS: %s", message)
     
     def info(self, message: str):
         """Print info"""
@@ -595,14 +1095,14 @@ class ScreenStepsUploader:
     def step(self, step_num: int, total_steps: int, message: str):
         """Print step"""
         print(f"{Colors.OKBLUE}[{step_num}/{total_steps}] {message}{Colors.ENDC}")
-        self.logger.info(f"STEP [{step_num}/{total_steps}]: {message}")
+        self.logger.info("STEP [%d/%d]: %s", step_num, total_steps, message)
     
     def substep(self, message: str, indent: int = 1):
         """Print substep"""
         if self.verbose:
             indent_str = "  " * indent
             print(f"{indent_str}→ {message}")
-        self.logger.debug(f"SUBSTEP: {message}")
+        self.logger.debug("SUBSTEP: %s", message)
     
     def set_totals(self, manuals: int = 1, chapters: int = 0, articles: int = 0, images: int = 0):
         """Set total counts for progress tracking"""
@@ -651,13 +1151,10 @@ class ScreenStepsUploader:
         progress_str = self.get_progress_string()
         time_est = self.estimate_time_remaining()
         print(f"{Colors.OKBLUE}{progress_str} {message} {Colors.OKCYAN}[ETA: {time_est}]{Colors.ENDC}")
-        self.logger.info(f"{progress_str} {message} [ETA: {time_est}]")
+        self.logger.info("%s %s [ETA: %s]", progress_str, message, time_est)
     
     def _html_to_content_blocks(self, html_content: str) -> List[Dict]:
         """Convert HTML content to ScreenSteps content blocks"""
-        import uuid
-        import re
-        
         if not html_content:
             return []
         
@@ -665,7 +1162,7 @@ class ScreenStepsUploader:
         
         # Split by paragraphs and headers
         # This is a simple conversion - for complex content, may need more sophisticated parsing
-        parts = re.split(r'(<h[1-6][^>]*>.*?</h[1-6]>|<p[^>]*>.*?</p>)', html_content, flags=re.DOTALL)
+        parts = HTML_PART_SPLIT_RE.split(html_content)
         
         step_number = 1
         for part in parts:
@@ -674,10 +1171,10 @@ class ScreenStepsUploader:
                 continue
             
             # Check if it's a header (treat as step)
-            header_match = re.match(r'<h([1-6])[^>]*>(.*?)</h\1>', part, re.DOTALL)
+            header_match = HEADER_RE.match(part)
             if header_match:
                 level = int(header_match.group(1))
-                title = re.sub(r'<[^>]+>', '', header_match.group(2)).strip()
+                title = TAG_RE.sub('', header_match.group(2)).strip()
                 
                 content_blocks.append({
                     'uuid': str(uuid.uuid4()),
@@ -711,11 +1208,11 @@ class ScreenStepsUploader:
         return content_blocks
     
     def upload(self, content_dir: Path, site_id: str, 
-               create_new: bool = True) -> Dict:
-        """Upload content to ScreenSteps"""
+               create_new: bool = True, fresh: bool = False, skip_site_check: bool = False) -> Dict:
+        """Upload content to ScreenSteps, continuing an interrupted upload unless fresh is set"""
         
-        # Track skipped images
-        skipped_images = []
+        # Track skipped images (only appended to and iterated once for the summary)
+        skipped_images = deque()
         
         # Track uploaded images
         uploaded_images_count = [0]  # Use list to allow modification in nested function
@@ -726,15 +1223,23 @@ class ScreenStepsUploader:
         
         # Step 1: Verify connection
         self.step(1, 6, "Verifying ScreenSteps connection")
-        try:
-            sites = self.api.get_sites()
-            site_found = any(s['id'] == int(site_id) for s in sites)
-            if not site_found:
-                raise ValueError(f"Site ID {site_id} not found")
-            self.success(f"Connected to ScreenSteps account: {self.api.account}")
-        except Exception as e:
-            self.error(f"Connection failed: {e}")
-            raise
+        if skip_site_check:
+            # An invalid site or credentials still fail on the first API call below
+            self.info("Skipping site verification (--skip-site-check)")
+        else:
+            try:
+                sites = self._get_sites_cached()
+                site_found = any(s['id'] == int(site_id) for s in sites)
+                if not site_found:
+                    # The cached list may predate the site, so ask the API before failing
+                    sites = self._get_sites_cached(refresh=True)
+                    site_found = any(s['id'] == int(site_id) for s in sites)
+                if not site_found:
+                    raise ValueError(f"Site ID {site_id} not found")
+                self.success(f"Connected to ScreenSteps account: {self.api.account}")
+            except Exception as e:
+                self.error(f"Connection failed: {e}")
+                raise
         
         # Step 2: Load content
         self.step(2, 6, "Loading converted content")
@@ -742,8 +1247,7 @@ class ScreenStepsUploader:
         if not toc_file:
             raise FileNotFoundError("No TOC file found in content directory")
         
-        with open(toc_file, 'r', encoding='utf-8') as f:
-            manual_data = json.load(f)
+        manual_data = load_json(toc_file)
         
         manual_info = manual_data['manual']
         self.substep(f"Manual: {manual_info['title']}")
@@ -751,21 +1255,40 @@ class ScreenStepsUploader:
         
         # Count totals for progress tracking
         total_chapters = len(manual_info['chapters'])
-        total_articles = sum(len(ch['articles']) for ch in manual_info['chapters'])
-        total_images = 0
+        total_articles = total_images = 0
+        article_image_counts = []  # Per chapter, per article; reused for progress tracking
         for chapter_data in manual_info['chapters']:
+            total_articles += len(chapter_data['articles'])
+            chapter_image_counts = []
             for article_data in chapter_data['articles']:
-                for step in article_data.get('steps', []):
-                    total_images += len(step.get('images', []))
+                image_count = 0
+                for step in article_data.get('steps') or ():
+                    image_count += len(step.get('images') or ())
+                chapter_image_counts.append(image_count)
+                total_images += image_count
+            article_image_counts.append(chapter_image_counts)
         
         self.set_totals(manuals=1, chapters=total_chapters, articles=total_articles, images=total_images)
         self.current_manual = 1
         
         # Step 3: Create manual with chapters
         self.step(3, 5, "Creating manual with chapters in ScreenSteps")
-        chapter_map = {}
+        # New chapter IDs by position of the chapter in the TOC (None if it was not created)
+        new_chapter_ids: List[Optional[str]] = [None] * len(manual_info['chapters'])
+        
+        state_file = content_dir / UPLOAD_STATE_FILE
+        state = {} if fresh else self.load_upload_state(state_file, site_id)
+        # VLP article ID -> ScreenSteps article ID of articles already created
+        uploaded_articles = state.get('articles', {})
+        resuming = bool(state)
         
-        if create_new:
+        if resuming:
+            # Continue the interrupted upload in the manual and chapters it created
+            manual_id = state['manual_id']
+            new_chapter_ids[:len(state['chapter_ids'])] = state['chapter_ids'][:len(new_chapter_ids)]
+            self.info(f"Resuming upload into manual ID: {manual_id} "
+                      f"({len(uploaded_articles)} articles already uploaded, use --fresh to start over)")
+        elif create_new:
             # Prepare chapters array for manual creation
             chapters_array = []
             for idx, chapter_data in enumerate(manual_info['chapters'], 1):
@@ -789,12 +1312,10 @@ class ScreenStepsUploader:
             manual_id = str(manual['id'])
             self.success(f"Created manual: {manual['title']} (ID: {manual_id})")
             
-            # Map old chapter IDs to new chapter IDs from response
-            if 'chapters' in manual:
-                for idx, chapter_data in enumerate(manual_info['chapters']):
-                    if idx < len(manual['chapters']):
-                        chapter_map[chapter_data['id']] = str(manual['chapters'][idx]['id'])
-                        self.substep(f"Created chapter: {manual['chapters'][idx]['title']}")
+            # Map TOC chapters to new chapter IDs from response
+            for idx, chapter in enumerate(manual.get('chapters', ())[:len(new_chapter_ids)]):
+                new_chapter_ids[idx] = str(chapter['id'])
+                self.substep(f"Created chapter: {chapter['title']}")
         else:
             # Use existing manual ID from file
             manual_id = str(manual_info['id'])
@@ -802,75 +1323,115 @@ class ScreenStepsUploader:
             
             # Still need to create chapters individually if using existing manual
             self.step(4, 5, "Creating chapters")
-            for idx, chapter_data in enumerate(manual_info['chapters'], 1):
-                chapter = self.api.create_chapter(
-                    site_id,
-                    manual_id,
-                    chapter_data['title'],
-                    position=chapter_data.get('order', idx),
-                    description=chapter_data.get('description', '')
-                )
-                chapter_map[chapter_data['id']] = str(chapter['id'])
+            chapters = self.api.create_chapters(site_id, manual_id, [
+                {
+                    'title': chapter_data['title'],
+                    'position': chapter_data.get('order', idx),
+                    'description': chapter_data.get('description', '')
+                }
+                for idx, chapter_data in enumerate(manual_info['chapters'], 1)
+            ])
+            for idx, chapter in enumerate(chapters):
+                new_chapter_ids[idx] = str(chapter['id'])
                 self.substep(f"Created: {chapter['title']}")
         
+        state = {
+            'site_id': str(site_id),
+            'manual_id': manual_id,
+            'chapter_ids': new_chapter_ids,
+            'articles': uploaded_articles
+        }
+        write_json_atomic(state_file, state)
+        
         # Step 4: Create articles and add content
         self.step(4, 5, "Creating articles and adding content")
         images_dir = content_dir / "images"  # Images are in content_dir/images/article_id/
         
-        for chapter_idx, chapter_data in enumerate(manual_info['chapters'], 1):
-            self.current_chapter = chapter_idx
-            chapter_id = chapter_map.get(chapter_data['id'])
-            if not chapter_id:
-                continue
-            
-            for article_data in chapter_data['articles']:
-                self.current_article += 1
-                article_vlp_id = article_data['id']  # VLP article ID for finding images
-                
-                # Show progress
-                self.progress(f"Creating article: {article_data['title']}")
-                
-                # Create article placeholder
-                article = self.api.create_article(
-                    site_id,
-                    chapter_id,
-                    article_data['title'],
-                    position=article_data.get('position', self.current_article)
-                )
-                article_id_new = str(article['id'])
-                
-                # Generate content blocks (uploads images internally)
-                content_blocks = self.api.generate_content_blocks(
-                    article_data,
-                    images_dir,
-                    site_id,
-                    article_id_new,
-                    article_vlp_id,  # Pass VLP ID to find images
-                    chapter_title=chapter_data.get('title', 'Unknown'),
-                    skipped_images=skipped_images,
-                    uploaded_images_count=uploaded_images_count
-                )
-                
-                # Update article contents
-                if content_blocks:
-                    try:
-                        self.api.update_article_contents(
+        # Articles are independent API round-trips, so several are uploaded at once.
+        # Results are collected in document order to keep progress and summaries stable.
+        article_jobs = []
+        article_position = 0
+        # Failures recorded by earlier runs are kept next to the ones of this run
+        failed_articles = self.load_failed_articles(content_dir)
+        # Content failures of this run by job index, so the record keeps document order
+        new_failures: Dict[int, Dict] = {}
+        state_lock = threading.Lock()
+        
+        def record_article(job_index: int, vlp_id: str, future: Future):
+            # Runs as soon as the article finishes, even when the loop below has already
+            # stopped, so every article created on the server is in the state file
+            if future.cancelled() or future.exception() is not None:
+                return
+            _, _, article_failure, article_id_new = future.result()
+            with state_lock:
+                # Failed contents are left to --resume; the article itself exists now
+                uploaded_articles[vlp_id] = article_id_new
+                if article_failure:
+                    new_failures[job_index] = article_failure
+                write_json_atomic(state_file, state)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as executor:
+                # Local bindings for the per-article loop
+                submit = executor.submit
+                upload_article = self._upload_article
+                add_job = article_jobs.append
+                for chapter_idx, (chapter_data, chapter_id) in enumerate(
+                        zip(manual_info['chapters'], new_chapter_ids), 1):
+                    if not chapter_id:
+                        continue
+                    chapter_title = chapter_data.get('title', 'Unknown')
+                    
+                    for article_data, image_count in zip(chapter_data['articles'],
+                                                         article_image_counts[chapter_idx - 1]):
+                        article_position += 1
+                        if article_data['id'] in uploaded_articles:
+                            # Uploaded before the previous run stopped
+                            future = Future()
+                            future.set_result((0, [], None, uploaded_articles[article_data['id']]))
+                            add_job((chapter_idx, article_data, image_count, future))
+                            continue
+                        future = submit(
+                            upload_article,
                             site_id,
-                            article_id_new,
-                            article_data['title'],
-                            content_blocks,
-                            publish=True
+                            chapter_id,
+                            chapter_title,
+                            article_data,
+                            article_data.get('position', article_position),
+                            images_dir
                         )
-                        if self.verbose:
-                            self.substep(f"  Updated content with {len(content_blocks)} blocks")
-                    except Exception as e:
-                        self.warning(f"Failed to update article contents: {e}")
+                        future.add_done_callback(
+                            lambda f, index=len(article_jobs), vlp_id=article_data['id']: record_article(index, vlp_id, f))
+                        add_job((chapter_idx, article_data, image_count, future))
                 
-                # Track processed articles and images
-                self.processed_articles += 1
-                # Count images in this article
-                for step in article_data.get('steps', []):
-                    self.processed_images += len(step.get('images', []))
+                try:
+                    for chapter_idx, article_data, image_count, future in article_jobs:
+                        article_uploaded, article_skipped, _, _ = future.result()
+                        uploaded_images_count[0] += article_uploaded
+                        skipped_images.extend(article_skipped)
+                        
+                        # Track processed articles and images
+                        self.current_chapter = chapter_idx
+                        self.current_article += 1
+                        self.processed_articles += 1
+                        self.processed_images += image_count
+                        
+                        # Show progress
+                        self.progress(f"Uploaded article: {article_data['title']}")
+                except BaseException:
+                    # Don't start articles that are still queued when one fails; the ones
+                    # in flight are recorded by record_article when the executor drains
+                    for *_, future in article_jobs:
+                        future.cancel()
+                    raise
+        finally:
+            # After the executor has waited for the articles in flight
+            with state_lock:
+                failed_articles.extend(new_failures[index] for index in sorted(new_failures))
+            self.save_failed_articles(content_dir, failed_articles)
+        self.current_chapter = len(manual_info['chapters'])
+        # Every article exists now; a later run starts a new upload
+        state_file.unlink()
         
         # Final progress update
         self.progress("Upload complete!")
@@ -883,6 +1444,8 @@ class ScreenStepsUploader:
             self.warning(f"Images skipped: {len(skipped_images)}")
         else:
             self.success("Images skipped: 0")
+        if new_failures:
+            self.warning(f"Articles without contents: {len(new_failures)} (retry with --resume)")
         self.info(f"Log file: {self.log_file}")
         
         # Display skipped images summary
@@ -892,21 +1455,15 @@ class ScreenStepsUploader:
             self.info("Images were replaced with alert: ERROR IMPORTING IMAGE - PLEASE RE-CREATE SCREENSHOT")
             print()
             
-            # Group by chapter
-            from collections import defaultdict
-            chapter_map = defaultdict(list)
+            # Group by chapter and article within chapter in one pass
+            skipped_by_chapter = defaultdict(lambda: defaultdict(list))
             for img in skipped_images:
-                chapter_map[img['chapter_title']].append(img)
+                skipped_by_chapter[img['chapter_title']][img['article_title']].append(img)
             
             # Display grouped by chapter and article
-            for chapter_title, images in chapter_map.items():
+            for chapter_title, article_map in skipped_by_chapter.items():
                 self.info(f"Chapter: {chapter_title}")
                 
-                # Group by article within chapter
-                article_map = defaultdict(list)
-                for img in images:
-                    article_map[img['article_title']].append(img)
-                
                 for article_title, article_images in article_map.items():
                     self.substep(f"  Article: {article_title}")
                     for img in article_images:
@@ -916,15 +1473,163 @@ class ScreenStepsUploader:
         
         return {
             'manual_id': manual_id,
-            'chapters': len(chapter_map),
+            'chapters': sum(1 for chapter_id in new_chapter_ids if chapter_id),
             'articles': self.processed_articles
         }
     
+    def _upload_article(self, site_id: str, chapter_id: str, chapter_title: str,
+                        article_data: Dict, position: int,
+                        images_dir: Path) -> Tuple[int, List[Dict], Optional[Dict], str]:
+        """Create one article with its images and contents
+
+        Returns (images uploaded, images skipped, failure, new article ID).
+        """
+        # Create article placeholder
+        article = self.api.create_article(
+            site_id,
+            chapter_id,
+            article_data['title'],
+            position=position
+        )
+        article_id_new = str(article['id'])
+        return (*self._fill_article(site_id, article_id_new, chapter_title, article_data, images_dir),
+                article_id_new)
+    
+    def _fill_article(self, site_id: str, article_id_new: str, chapter_title: str,
+                      article_data: Dict, images_dir: Path) -> Tuple[int, List[Dict], Optional[Dict]]:
+        """Upload the images and contents of a created article; return (images uploaded, images skipped, failure)"""
+        skipped_images = []
+        uploaded_images_count = [0]
+        failure = None
+        article_vlp_id = article_data['id']  # VLP article ID for finding images
+        
+        def build_content_blocks() -> List[Dict]:
+            # Generate content blocks (uploads images internally)
+            skipped_images.clear()
+            uploaded_images_count[0] = 0
+            return self.api.generate_content_blocks(
+                article_data,
+                images_dir,
+                site_id,
+                article_id_new,
+                article_vlp_id,  # Pass VLP ID to find images
+                chapter_title=chapter_title,
+                skipped_images=skipped_images,
+                uploaded_images_count=uploaded_images_count
+            )
+        
+        content_blocks = build_content_blocks()
+        
+        # Update article contents
+        if content_blocks:
+            try:
+                try:
+                    self.api.update_article_contents(
+                        site_id,
+                        article_id_new,
+                        article_data['title'],
+                        content_blocks,
+                        publish=True
+                    )
+                except requests.exceptions.HTTPError as e:
+                    # A 404 can mean an image recorded by an earlier run was deleted on the
+                    # server: forget those images and save the contents once more with new uploads
+                    asset_ids = {block['image_asset_id'] for block in content_blocks
+                                 if block['type'] == 'ImageContentBlock'}
+                    if (e.response is None or e.response.status_code != 404
+                            or not self.api.forget_images(asset_ids)):
+                        raise
+                    self.warning(f"Uploading the images of {article_data['title']} again")
+                    content_blocks = build_content_blocks()
+                    self.api.update_article_contents(
+                        site_id,
+                        article_id_new,
+                        article_data['title'],
+                        content_blocks,
+                        publish=True
+                    )
+                if self.verbose:
+                    self.substep(f"  Updated content for {article_data['title']} with {len(content_blocks)} blocks")
+            except Exception as e:
+                # Transient errors were already retried by the session; keep what is needed to retry later
+                self.warning(f"Failed to update article contents for {article_data['title']}: {e}")
+                failure = {
+                    'site_id': site_id, 'article_id': article_id_new, 'article_vlp_id': article_vlp_id,
+                    'chapter_title': chapter_title, 'article_title': article_data['title'], 'error': str(e)
+                }
+        
+        return uploaded_images_count[0], skipped_images, failure
+    
+    def resume(self, content_dir: Path, site_id: str) -> Dict:
+        """Retry the contents of articles recorded as failed by an earlier upload"""
+        self.header("ScreenSteps Content Uploader - Resume")
+        failed_articles = self.load_failed_articles(content_dir)
+        if not failed_articles:
+            self.success("No failed articles to resume")
+            return {'articles': 0, 'failed': 0}
+        
+        toc_file = self._find_toc_file(content_dir)
+        if not toc_file:
+            raise FileNotFoundError("No TOC file found in content directory")
+        manual_info = load_json(toc_file)['manual']
+        articles_by_id = {
+            article_data['id']: article_data
+            for chapter_data in manual_info['chapters']
+            for article_data in chapter_data['articles']
+        }
+        images_dir = content_dir / "images"
+        
+        still_failed = []
+        resumed = 0
+        for failure in failed_articles:
+            article_data = articles_by_id.get(failure['article_vlp_id'])
+            if failure['site_id'] != str(site_id) or article_data is None:
+                # Belongs to another site or content directory; keep it for that run
+                still_failed.append(failure)
+                continue
+            self.info(f"Resuming article: {failure['article_title']}")
+            _, _, article_failure = self._fill_article(
+                site_id, failure['article_id'], failure['chapter_title'], article_data, images_dir
+            )
+            if article_failure:
+                still_failed.append(article_failure)
+            else:
+                resumed += 1
+                self.success(f"Updated article: {failure['article_title']}")
+        
+        self.save_failed_articles(content_dir, still_failed)
+        if still_failed:
+            self.warning(f"Articles still without contents: {len(still_failed)}")
+        return {'articles': resumed, 'failed': len(still_failed)}
+    
+    def _get_sites_cached(self, refresh: bool = False) -> List[Dict]:
+        """Return the account's sites, from a cache file younger than SITES_CACHE_TTL if possible"""
+        cache_file = SITES_CACHE_DIR / f"{self.api.account}-sites.json"
+        if not refresh:
+            try:
+                if time.time() - cache_file.stat().st_mtime < SITES_CACHE_TTL:
+                    return load_json(cache_file)
+            except (OSError, ValueError):
+                pass
+        
+        sites = self.api.get_sites()
+        try:
+            SITES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(cache_file, sites)
+        except OSError as e:
+            self.logger.debug("Could not cache site list in %s: %s", cache_file, e)
+        return sites
+    
     def _find_toc_file(self, content_dir: Path) -> Optional[Path]:
         """Find the TOC JSON file"""
-        for file in content_dir.glob('*.json'):
-            if file.stem != 'manifest':  # Exclude manifest files
-                return file
+        # Stop at the first match instead of globbing the whole directory
+        with os.scandir(content_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.endswith('.json') and not name.startswith('.')
+                        and name != 'manifest.json'  # Exclude manifest files
+                        and entry.is_file()):
+                    return Path(entry.path)
         return None
 
 def print_usage_examples():
@@ -960,6 +1665,15 @@ def print_usage_examples():
        --site 12345 \\
        --no-create
 
+4. Retry article contents that failed in a previous upload:
+   python screensteps_uploader.py \\
+       --content output/HOL-2601-03-VCF-L \\
+       --account myaccount \\
+       --user admin \\
+       --token abc123xyz \\
+       --site 12345 \\
+       --resume
+
 ╔══════════════════════════════════════════════════════════════════════════╗
 ║                    GENERATING API TOKEN                                  ║
 ╚══════════════════════════════════════════════════════════════════════════╝
@@ -1005,6 +1719,15 @@ def main():
                        help='ScreenSteps site ID (or SS_SITE env var)')
     parser.add_argument('--no-create', action='store_true',
                        help='Use existing manual (don\'t create new)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Only retry the contents of articles recorded in .vlp2ss-failed.json in the '
+                            'content directory; an interrupted upload is continued automatically '
+                            'without this flag')
+    parser.add_argument('--fresh', action='store_true',
+                       help='Ignore the progress of an interrupted upload (.vlp2ss-state.json in the '
+                            'content directory) and create a new manual')
+    parser.add_argument('--skip-site-check', action='store_true',
+                       help='Don\'t verify the site ID before uploading')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Enable verbose logging')
     parser.add_argument('--version', action='version',
@@ -1013,6 +1736,9 @@ def main():
                        help='Show detailed usage examples')
     parser.add_argument('--suffix', action='store_true',
                        help='Append -python suffix to manual titles')
+    parser.add_argument('--gzip', action='store_true',
+                       help='Send large article contents gzip-compressed (falls back to uncompressed '
+                            'if the server rejects them)')
     
     args = parser.parse_args()
     
@@ -1022,7 +1748,7 @@ def main():
             print_usage_examples()
             return 0
         parser.print_help()
-        print("\n" + "="*70)
+        print("\n" + SEPARATOR)
         print_usage_examples()
         return 0
     
@@ -1031,6 +1757,7 @@ def main():
         print(f"{Colors.FAIL}Error: --account, --user, --token, and --site are required, or set SS_ACCOUNT, SS_USER, SS_TOKEN, and SS_SITE environment variables.{Colors.ENDC}")
         return 1
     
+    uploader = None
     try:
         start_time = time.time()
         
@@ -1044,14 +1771,20 @@ def main():
             args.user,
             args.token,
             verbose=args.verbose,
-            suffix=args.suffix
+            suffix=args.suffix,
+            gzip_requests=args.gzip
         )
         
-        uploader.upload(
-            content_dir,
-            args.site,
-            create_new=not args.no_create
-        )
+        if args.resume:
+            uploader.resume(content_dir, args.site)
+        else:
+            uploader.upload(
+                content_dir,
+                args.site,
+                create_new=not args.no_create,
+                fresh=args.fresh,
+                skip_site_check=args.skip_site_check
+            )
         
         elapsed = time.time() - start_time
         minutes, seconds = divmod(int(elapsed), 60)
@@ -1066,6 +1799,12 @@ def main():
         print(f"{Colors.FAIL}Error: {e}{Colors.ENDC}")
         logging.exception("Upload failed")
         return 1
+    finally:
+        # Keep the record of uploaded images even if the upload stopped part way
+        if uploader is not None:
+            uploader.api.close()
+            uploader.save_image_map()
+            uploader.close()
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -14,21 +14,101 @@ import zipfile
 import shutil
 import argparse
 import logging
+import queue
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, List, Optional, Tuple
 import re
-from html import unescape
 import uuid
-from bs4 import BeautifulSoup
-from PIL import Image
-from bs4 import Tag # Added this import for Tag type hinting
+from dataclasses import dataclass
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4 import NavigableString
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the C-backed lxml parsers, fall back to the stdlib/pure-Python ones if it is not installed
+try:
+    from lxml import etree as ET
+    from lxml import html as lxml_html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    import xml.etree.ElementTree as ET
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
 
 # --- Constants ---
 APP_VERSION = "1.0.3"
 
+# Log records never show thread/process info, skip collecting it for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Read/write buffer used when extracting ZIP members
+ZIP_COPY_BUFFER = 1 << 20
+# Threads extracting ZIP members, each with its own handle on the archive (zlib releases the GIL)
+ZIP_EXTRACT_WORKERS = os.cpu_count() or 1
+# Threads used to write article files and copy step images in parallel; the work is I/O bound
+OUTPUT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Worker processes converting the VLP HTML of a manual; BeautifulSoup parsing is CPU bound
+CONVERT_WORKERS = os.cpu_count() or 1
+# Free-threaded CPython (3.13+ built with --disable-gil) can convert on threads instead of processes
+FREE_THREADED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+# Below this many distinct HTML fragments starting the worker processes costs more than it saves
+PARALLEL_CONVERT_MIN = 32
+# Time estimate weights, based on user data: ~10-15 seconds per article + ~2 seconds per image
+AVG_SECONDS_PER_ARTICLE = 12.5
+AVG_SECONDS_PER_IMAGE = 2.0
+# Minimum seconds between progress lines printed to the console
+PROGRESS_PRINT_INTERVAL = 0.25
+
+# Precompiled patterns
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_DASH_RE = re.compile(r'[-\s]+')
+# ASCII fast path for slugify: keep word characters, turn whitespace/dashes into '-', drop the rest
+SLUG_TABLE = str.maketrans({
+    c: ('-' if c.isspace() or c == '-' else None)
+    for c in map(chr, range(128))
+    if not (c.isalnum() or c == '_')
+})
+SLUG_DASHES_RE = re.compile(r'-{2,}')
+TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+RELATIVE_SRC_RE = re.compile(r'src=["\']\./')
+BLOCK_STYLE_CLASS_RE = re.compile(r'block-style-')
+# VLP block-style div classes and the ScreenSteps style each maps to
+BLOCK_STYLE_MAP = {
+    'block-style-introduction': 'introduction',
+    'block-style-tip': 'tip',
+    'block-style-info': 'info',
+    'block-style-alert': 'alert',
+    'block-style-warning': 'warning'
+}
+BLOCK_STYLE_SELECTOR = ', '.join(f'div.{cls}' for cls in BLOCK_STYLE_MAP)
+# Build only the elements the image and style helpers look at
+IMG_STRAINER = SoupStrainer('img')
+BLOCK_STYLE_STRAINER = SoupStrainer('div', class_=BLOCK_STYLE_CLASS_RE)
+# VLP paragraph classes converted to ScreenSteps styled blocks by _convert_vlp_paragraph_styles.
+# NOTE: CSS classes like c10, c44, c48, etc. are document-specific and NOT reliable
+# indicators of styled blocks. They are used for regular paragraph formatting (indentation,
+# alignment, etc.) and should NOT be mapped to ScreenSteps styled blocks.
+#
+# Styled blocks should only be applied based on semantic HTML structure or explicit
+# content patterns, not generic CSS classes from Google Docs exports.
+# Add mappings here ONLY if you identify a truly consistent semantic pattern.
+PARAGRAPH_CLASS_STYLES: Dict[str, str] = {}
+YOUTUBE_THUMB_ID_RE = re.compile(r'youtube\.com/vi/([^/]+)/')
+IMG_TAG_RE = re.compile(r'<img\b[^>]*?/?>', re.IGNORECASE)
+
 # ANSI color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -41,11 +121,15 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Separator line framing headers
+HEADER_BAR = f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}"
+
 class ProgressLogger:
     """Enhanced logging with progress indicators"""
     
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
+        self._listener = None
         self.setup_logging()
         self.start_time = time.time()
         self.total_manuals = 0
@@ -57,6 +141,13 @@ class ProgressLogger:
         self.current_article = 0
         self.processed_articles = 0
         self.processed_images = 0
+        self._last_print = float('-inf')
+    
+    def __getstate__(self):
+        # Conversion worker processes get a copy without the background log writer
+        state = self.__dict__.copy()
+        state['_listener'] = None
+        return state
     
     def setup_logging(self):
         """Configure logging with file and console handlers"""
@@ -65,15 +156,10 @@ class ProgressLogger:
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"vlp_converter_{timestamp}.log"
+        self.log_file = log_file
         
         # File handler - detailed logs
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
+        file_handler = self._file_handler()
         
         # Console handler - user-friendly output
         console_handler = logging.StreamHandler()
@@ -81,25 +167,54 @@ class ProgressLogger:
         console_formatter = logging.Formatter('%(message)s')
         console_handler.setFormatter(console_formatter)
         
+        # File writes happen on a background thread; logging calls only enqueue the record
+        log_queue = queue.SimpleQueue()
+        self._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._listener.start()
+        
         # Configure root logger
         logger = logging.getLogger()
         logger.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
+        logger.addHandler(QueueHandler(log_queue))
         logger.addHandler(console_handler)
-        
-        self.log_file = log_file
+    
+    def _file_handler(self) -> logging.FileHandler:
+        """Build the detailed handler that appends to this run's log file"""
+        file_handler = logging.FileHandler(self.log_file)
+        file_handler.setLevel(logging.DEBUG)
+        file_formatter = logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        file_handler.setFormatter(file_formatter)
+        return file_handler
+    
+    def use_direct_file_logging(self):
+        """Write to the log file directly, for worker processes that have no log writer thread"""
+        logger = logging.getLogger()
+        for handler in [h for h in logger.handlers if isinstance(h, QueueHandler)]:
+            logger.removeHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(self._file_handler())
+    
+    def close(self):
+        """Flush pending records to the log file, stop the background writer and close the file"""
+        if self._listener is not None:
+            self._listener.stop()
+            # stop() only drains the queue; the file handler it wrote to is still open
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
     
     def header(self, message: str):
         """Print a header message"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{message.center(70)}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}\n")
-        logging.info(f"HEADER: {message}")
+        print(f"\n{HEADER_BAR}\n{Colors.HEADER}{Colors.BOLD}{message.center(70)}{Colors.ENDC}\n{HEADER_BAR}\n")
+        logging.info("HEADER: %s", message)
     
     def success(self, message: str):
         """Print a success message"""
         print(f"{Colors.OKGREEN}✓ {message}{Colors.ENDC}")
-        logging.info(f"SUCCESS: {message}")
+        logging.info("SUCCESS: %s", message)
     
     def info(self, message: str):
         """Print an info message"""
@@ -120,14 +235,14 @@ class ProgressLogger:
     def step(self, step_num: int, total_steps: int, message: str):
         """Print a step progress message"""
         print(f"{Colors.OKBLUE}[{step_num}/{total_steps}] {message}{Colors.ENDC}")
-        logging.info(f"STEP [{step_num}/{total_steps}]: {message}")
+        logging.info("STEP [%d/%d]: %s", step_num, total_steps, message)
     
     def substep(self, message: str, indent: int = 1):
         """Print a sub-step message"""
         if self.verbose:
             indent_str = "  " * indent
             print(f"{indent_str}→ {message}")
-        logging.debug(f"SUBSTEP: {message}")
+        logging.debug("SUBSTEP: %s", message)
     
     def set_totals(self, manuals: int = 1, chapters: int = 0, articles: int = 0, images: int = 0):
         """Set total counts for progress tracking"""
@@ -148,21 +263,11 @@ class ProgressLogger:
         if self.processed_articles == 0:
             return "Calculating..."
         
-        elapsed = time.time() - self.start_time
-        
-        # Use weighted formula: articles are primary driver, images add time
-        # Based on user data: ~10-15 seconds per article + ~2 seconds per image
-        avg_time_per_article = 12.5  # seconds
-        avg_time_per_image = 2.0     # seconds
-        
-        # Calculate estimated total time
-        estimated_total = (self.total_articles * avg_time_per_article) + (self.total_images * avg_time_per_image)
-        
-        # Calculate progress-based estimate
-        articles_remaining = self.total_articles - self.processed_articles
-        images_remaining = self.total_images - self.processed_images
-        
-        estimated_remaining = (articles_remaining * avg_time_per_article) + (images_remaining * avg_time_per_image)
+        # Weighted estimate: articles are the primary driver, images add time
+        estimated_remaining = (
+            (self.total_articles - self.processed_articles) * AVG_SECONDS_PER_ARTICLE
+            + (self.total_images - self.processed_images) * AVG_SECONDS_PER_IMAGE
+        )
         
         # Format time
         minutes, seconds = divmod(int(estimated_remaining), 60)
@@ -175,27 +280,147 @@ class ProgressLogger:
         """Print a progress message with percentages and time estimate"""
         progress_str = self.get_progress_string()
         time_est = self.estimate_time_remaining()
-        print(f"{Colors.OKBLUE}{progress_str} {message} {Colors.OKCYAN}[ETA: {time_est}]{Colors.ENDC}")
-        logging.info(f"{progress_str} {message} [ETA: {time_est}]")
+        # Throttle console output; every progress message still goes to the log
+        now = time.monotonic()
+        if now - self._last_print >= PROGRESS_PRINT_INTERVAL:
+            self._last_print = now
+            print(f"{Colors.OKBLUE}{progress_str} {message} {Colors.OKCYAN}[ETA: {time_est}]{Colors.ENDC}")
+        logging.info("%s %s [ETA: %s]", progress_str, message, time_est)
 
 # Helper functions for content block generation
 def generate_uuid():
     """Generate a UUID v4 for content blocks"""
     return str(uuid.uuid4()).upper()
 
+@lru_cache(maxsize=2048)
 def slugify(text):
-    """Convert text to URL-friendly slug"""
+    """Convert text to URL-friendly slug (memoized; titles repeat a lot)"""
     text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
-    return text.strip('-')
+    if text.isascii():
+        return SLUG_DASHES_RE.sub('-', text.translate(SLUG_TABLE)).strip('-')
+    return SLUG_DASH_RE.sub('-', SLUG_STRIP_RE.sub('', text)).strip('-')
+
+def dump_json(obj, pretty: bool = False) -> bytes:
+    """Serialize obj as compact (or, with pretty, indented) UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(obj)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def write_json_file(path: Path, obj, pretty: bool = False) -> None:
+    """Write obj to path as UTF-8 JSON (indented with pretty)"""
+    with open(path, 'wb') as f:
+        f.write(dump_json(obj, pretty))
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents in kernel space with os.copy_file_range, falling back to shutil.copyfile"""
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                chunk = max(os.fstat(fsrc.fileno()).st_size, 1 << 20)
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), chunk):
+                    pass
+            return
+        except OSError:
+            # Not supported by the kernel or filesystem (e.g. ENOSYS, EXDEV on older kernels)
+            pass
+    shutil.copyfile(src, dst)
+
+@lru_cache(maxsize=1024)
+def extract_description(html: str, max_length: int = 200) -> str:
+    """Extract plain text description from HTML (memoized; boilerplate content repeats)"""
+    if not html:
+        return ""
+    
+    if lxml_html is not None:
+        # Text of the parsed fragment: entities decoded, no false tag matches on '>' in attributes
+        try:
+            text = lxml_html.fromstring(html).text_content()
+        except ET.ParserError:
+            # Only whitespace or comments
+            text = ''
+    else:
+        # Remove HTML tags
+        text = TAG_RE.sub('', html)
+    # Remove extra whitespace
+    text = WHITESPACE_RE.sub(' ', text).strip()
+    
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+    
+    return text
+
+def _copy_to_all(src: Path, destinations: List[Path], hardlink: bool = False) -> None:
+    """
+    Copy src to every destination.
+    
+    With hardlink the destinations are hardlinks to src itself, so no image data is
+    written at all; src on another filesystem (EXDEV) or without hardlink support is copied.
+    """
+    for dst in destinations:
+        if hardlink:
+            try:
+                if dst.exists():
+                    dst.unlink()
+                os.link(src, dst)
+                continue
+            except OSError:
+                pass
+        _fast_copy(src, dst)
+
+def _rmtree_in_background(path: Path) -> threading.Thread:
+    """
+    Delete a directory tree on a background thread.
+    
+    The thread is not a daemon, so the interpreter waits for it before exiting; the
+    path is made absolute first so a later change of working directory can't redirect it.
+    """
+    thread = threading.Thread(target=shutil.rmtree, args=(path.resolve(),),
+                              kwargs={'ignore_errors': True}, name=f"rmtree-{path.name}")
+    thread.start()
+    return thread
+
+def _discard_tree(path: Path) -> None:
+    """
+    Rename a directory to a hidden sibling so the name is free at once, then delete it in the background.
+    
+    Hidden siblings left behind by an earlier run that exited before deleting them are deleted as well.
+    """
+    prefix = f".{path.name}."
+    with os.scandir(path.parent) as entries:
+        stale = [entry.path for entry in entries
+                 if entry.name.startswith(prefix) and entry.name.endswith('.old')
+                 and entry.is_dir(follow_symlinks=False)]
+    for stale_path in stale:
+        _rmtree_in_background(Path(stale_path))
+    
+    trash = path.with_name(f".{path.name}.{os.getpid()}.{time.time_ns()}.old")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        # Cannot be renamed (e.g. in use on Windows or the working directory itself): delete in place
+        shutil.rmtree(path)
+        return
+    _rmtree_in_background(trash)
+
+def parse_html_fragment(html_content, parse_only=None):
+    """Parse an HTML fragment with the fastest available parser, optionally only the parts a strainer matches"""
+    return BeautifulSoup(html_content, HTML_PARSER, parse_only=parse_only)
+
+def fragment_to_html(soup):
+    """Serialize a parsed fragment without the <html>/<body> wrapper lxml adds"""
+    if soup.body is None:
+        return str(soup)
+    # lxml moves head-only elements such as <style> or <meta> into <head>
+    return ''.join(part.decode_contents() for part in (soup.head, soup.body) if part is not None)
 
 def extract_images_from_html(html_content):
     """Extract image references from HTML"""
     if not html_content:
         return []
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_html_fragment(html_content, IMG_STRAINER)
     images = []
     
     for img in soup.find_all('img'):
@@ -214,37 +439,39 @@ def extract_images_from_html(html_content):
     
     return images
 
-def remove_images_from_html(html_content):
-    """Remove img tags from HTML"""
+def remove_images_from_html(html_content, strict: bool = False):
+    """
+    Remove img tags from HTML.
+    
+    By default the tags are cut out with a regex and the rest of the markup is left as is;
+    pass strict=True to go through the HTML parser, which also leaves images inside
+    comments alone and normalizes the remaining markup.
+    """
     if not html_content:
         return ""
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    if not strict:
+        return IMG_TAG_RE.sub('', html_content)
+    
+    soup = parse_html_fragment(html_content)
     for img in soup.find_all('img'):
         img.decompose()
-    return str(soup)
+    return fragment_to_html(soup)
 
+@lru_cache(maxsize=1024)
 def detect_style_from_html(html_content):
     """Detect ScreenSteps style from VLP HTML"""
     if not html_content:
         return None
     
-    style_map = {
-        'block-style-introduction': 'introduction',
-        'block-style-tip': 'tip',
-        'block-style-info': 'info',
-        'block-style-alert': 'alert',
-        'block-style-warning': 'warning'
-    }
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
-    for div in soup.find_all('div', class_=True):
-        div_classes = div.get('class')
-        if div_classes:
-            for class_name in div_classes:
-                if class_name in style_map:
-                    return style_map[class_name]
-    
+    soup = parse_html_fragment(html_content, BLOCK_STYLE_STRAINER)
+    # First div carrying any block-style class, found in one traversal
+    div = soup.select_one(BLOCK_STYLE_SELECTOR)
+    if div is None:
+        return None
+    for class_name in div.get('class'):
+        if class_name in BLOCK_STYLE_MAP:
+            return BLOCK_STYLE_MAP[class_name]
     return None
 
 def remove_style_divs(html_content):
@@ -252,10 +479,23 @@ def remove_style_divs(html_content):
     if not html_content:
         return ""
     
-    soup = BeautifulSoup(html_content, 'html.parser')
-    for div in soup.find_all('div', class_=re.compile(r'block-style-')):
+    soup = parse_html_fragment(html_content)
+    for div in soup.find_all('div', class_=BLOCK_STYLE_CLASS_RE):
         div.unwrap()
-    return str(soup)
+    return fragment_to_html(soup)
+
+@dataclass
+class ContentNode:
+    """A parsed VLP content node (chapter, article or step) with its parsed children"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10): manuals hold tens of thousands of nodes
+    __slots__ = ('id', 'title', 'order', 'content', 'images', 'children', 'language')
+    id: Optional[str]
+    title: str
+    order: int
+    content: str
+    images: List[Dict]
+    children: List['ContentNode']
+    language: str
 
 class VLPParser:
     """Parser for VLP XML content"""
@@ -263,31 +503,78 @@ class VLPParser:
     def __init__(self, logger: ProgressLogger):
         self.logger = logger
         self.verbose = logger.verbose  # Enable verbose logging for debugging
+        # Cleaned HTML per distinct input; VLP exports repeat boilerplate content across steps
+        self._clean_html_cache: Dict[str, str] = {}
+        # One timestamp for the whole conversion run
+        self._now_iso = datetime.now().isoformat()
     
     def parse_xml(self, xml_path: Path) -> Dict:
-        """Parse VLP content.xml file"""
+        """
+        Parse VLP content.xml file.
+        The file is stream-parsed: each ContentNode is turned into a dict as soon as its end
+        tag is read and is then removed from the tree, so only the path to the current node
+        is kept in memory instead of the whole document.
+        """
         self.logger.info(f"Parsing VLP XML: {xml_path}")
         
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
+            root = None
+            chapters = []
+            # Elements from the root down to the one being parsed
+            path = []
+            # For each open ContentNode: (list it is appended to, its parsed children, its level),
+            # or None for nodes outside the contentNodes/children hierarchy
+            open_nodes = []
+            # Totals for progress tracking, counted here so flattening needs no extra pass:
+            # level 1 nodes become articles, images of levels 1 and 2 are uploaded
+            total_articles = 0
+            total_images = 0
+            
+            for event, elem in self._iterparse(xml_path):
+                if event == 'start':
+                    if root is None:
+                        root = elem
+                    if elem.tag == 'ContentNode':
+                        parent = path[-1] if path else None
+                        if parent is not None and parent.tag == 'contentNodes' and len(path) == 2:
+                            open_nodes.append((chapters, [], 0))
+                        elif (parent is not None and parent.tag == 'children' and len(path) > 2
+                              and path[-2].tag == 'ContentNode' and open_nodes[-1] is not None):
+                            open_nodes.append((open_nodes[-1][1], [], open_nodes[-1][2] + 1))
+                        else:
+                            open_nodes.append(None)
+                    path.append(elem)
+                    continue
+                
+                path.pop()
+                if elem.tag != 'ContentNode':
+                    continue
+                entry = open_nodes.pop()
+                if entry is None:
+                    continue
+                siblings, children, level = entry
+                node_data = self._parse_content_node(elem, children)
+                siblings.append(node_data)
+                if level == 1:
+                    total_articles += 1
+                if level in (1, 2):
+                    total_images += len(node_data.images)
+                # Children are already parsed, drop the node from the tree
+                path[-1].remove(elem)
             
             manual_data = {
                 'id': root.get('id'),
                 'name': root.findtext('name', ''),
                 'language': root.findtext('defaultLanguageCode', 'en'),
                 'format': root.findtext('dataFormat', 'default'),
-                'chapters': []
+                'chapters': chapters,
+                'totals': {
+                    'chapters': len(chapters),
+                    'articles': total_articles,
+                    'images': total_images
+                }
             }
             
-            # Parse content nodes (chapters and articles)
-            content_nodes = root.find('contentNodes')
-            if content_nodes is not None:
-                for node in content_nodes.findall('ContentNode'):
-                    parsed_node = self._parse_content_node(node)
-                    if parsed_node:
-                        manual_data['chapters'].append(parsed_node)
-            
             self.logger.success(f"Parsed manual: {manual_data['name']}")
             self.logger.substep(f"Found {len(manual_data['chapters'])} top-level sections")
             
@@ -300,45 +587,68 @@ class VLPParser:
             self.logger.error(f"Unexpected error parsing XML: {e}")
             raise
     
-    def _parse_content_node(self, node: ET.Element, level: int = 0) -> Optional[Dict]:
-        """Recursively parse content nodes (chapters/articles)"""
-        node_data = {
-            'id': node.get('id'),
-            'title': node.findtext('title', ''),
-            'order': int(node.findtext('orderIndex', '0')),
-            'content': '',
-            'images': [],
-            'children': []
-        }
+    @staticmethod
+    def _iterparse(xml_path: Path):
+        """Iterate over start/end events of content.xml (lxml: allow huge text nodes, drop blank text)"""
+        if HTML_PARSER == 'lxml':
+            return ET.iterparse(str(xml_path), events=('start', 'end'), huge_tree=True, remove_blank_text=True)
+        return ET.iterparse(str(xml_path), events=('start', 'end'))
+    
+    @staticmethod
+    def _child_elements(node: ET.Element) -> Dict[str, ET.Element]:
+        """Map each child tag to its first element in a single pass over the children"""
+        children = {}
+        for child in node:
+            children.setdefault(child.tag, child)
+        return children
+    
+    @staticmethod
+    def _child_text(children: Dict[str, ET.Element], tag: str, default: str = '') -> str:
+        """Same as Element.findtext() on a mapping built by _child_elements"""
+        child = children.get(tag)
+        if child is None:
+            return default
+        return child.text or ''
+    
+    def _parse_content_node(self, node: ET.Element, children: List[ContentNode]) -> ContentNode:
+        """Build the ContentNode for a content node (chapter/article) whose children are already parsed"""
+        fields = self._child_elements(node)
+        node_data = ContentNode(
+            id=node.get('id'),
+            title=self._child_text(fields, 'title'),
+            order=int(self._child_text(fields, 'orderIndex', '0')),
+            content='',
+            images=[],
+            children=children,
+            language='en'
+        )
         
         # Parse localizations
-        localizations = node.find('localizations')
+        localizations = fields.get('localizations')
         if localizations is not None:
-            locale_content = localizations.find('LocaleContent')
+            # Single-locale exports (the common case) have the LocaleContent as first child
+            locale_content = next(iter(localizations), None)
+            if locale_content is not None and locale_content.tag != 'LocaleContent':
+                locale_content = self._child_elements(localizations).get('LocaleContent')
             if locale_content is not None:
-                node_data['title'] = locale_content.findtext('title', node_data['title'])
-                node_data['language'] = locale_content.findtext('languageCode', 'en')
-                node_data['content'] = locale_content.findtext('content', '')
+                locale_fields = self._child_elements(locale_content)
+                node_data.title = self._child_text(locale_fields, 'title', node_data.title)
+                node_data.language = self._child_text(locale_fields, 'languageCode', 'en')
+                node_data.content = self._child_text(locale_fields, 'content')
                 
                 # Parse images
-                images = locale_content.find('images')
+                images = locale_fields.get('images')
                 if images is not None:
-                    for img in images.findall('img'):
-                        node_data['images'].append({
+                    for img in images:
+                        if img.tag != 'img':
+                            continue
+                        node_data.images.append({
                             'src': img.get('src', ''),
                             'filename': img.get('filename', ''),
                             'width': img.get('width', ''),
                             'height': img.get('height', '')
                         })
         
-        # Parse children recursively
-        children = node.find('children')
-        if children is not None:
-            for child_node in children.findall('ContentNode'):
-                child_data = self._parse_content_node(child_node, level + 1)
-                if child_data:
-                    node_data['children'].append(child_data)
-        
         return node_data
     
     def flatten_structure(self, manual_data: Dict) -> List[Dict]:
@@ -348,33 +658,22 @@ class VLPParser:
         - Level 2 nodes become articles  
         - Level 3 nodes become steps (content_blocks) within articles
         """
-        # First pass: count totals for progress tracking
-        total_chapters = len(manual_data['chapters'])
-        total_articles = 0
-        total_images = 0
-        
-        for chapter_node in manual_data['chapters']:
-            if chapter_node.get('children'):
-                total_articles += len(chapter_node['children'])
-                for article_node in chapter_node['children']:
-                    # Count images in article
-                    total_images += len(article_node.get('images', []))
-                    # Count images in steps
-                    if article_node.get('children'):
-                        for step_node in article_node['children']:
-                            total_images += len(step_node.get('images', []))
-        
-        # Set totals for progress tracking
-        self.logger.set_totals(manuals=1, chapters=total_chapters, articles=total_articles, images=total_images)
+        # Set totals for progress tracking (counted by parse_xml)
+        totals = manual_data['totals']
+        self.logger.set_totals(manuals=1, chapters=totals['chapters'], articles=totals['articles'],
+                               images=totals['images'])
         self.logger.current_manual = 1
         
+        # Convert the HTML of all nodes up front on every core, the loop below then reads the cache
+        self._clean_html_parallel(manual_data)
+        
         chapters = []
         
         for chapter_idx, chapter_node in enumerate(manual_data['chapters'], 1):
             self.logger.current_chapter = chapter_idx
             
-            chapter_title = chapter_node['title']
-            chapter_desc = self._clean_html(chapter_node['content'])
+            chapter_title = chapter_node.title
+            chapter_desc = self._clean_html(chapter_node.content)
 
             # Handle missing chapter titles (often Copyright page)
             if not chapter_title:
@@ -384,9 +683,9 @@ class VLPParser:
                     chapter_title = "Unknown Title"
 
             chapter = {
-                'id': chapter_node['id'],
+                'id': chapter_node.id,
                 'title': chapter_title,
-                'order': chapter_node['order'],
+                'order': chapter_node.order,
                 'description': chapter_desc,
                 'articles': []
             }
@@ -404,27 +703,27 @@ class VLPParser:
                     'title': chapter['title'],
                     'order': 0,
                     'content': chapter['description'],
-                    'images': chapter_node.get('images', [])
+                    'images': chapter_node.images
                 }
                 
                 # Create the article
                 desc_article = {
                     'id': generate_uuid(),
                     'title': chapter['title'],
-                    'vlp_order': 0,  # Place at start
                     'position': current_position,
+                    'vlp_order': 0,  # Place at start
                     'steps': [step]
                 }
                 
                 chapter['articles'].append(desc_article)
                 self.logger.processed_articles += 1
-                self.logger.processed_images += len(chapter_node.get('images', []))
+                self.logger.processed_images += len(chapter_node.images)
                 current_position += 1
             
             # Process level 2 children as articles
-            if chapter_node.get('children'):
+            if chapter_node.children:
                 # Sort articles by VLP order, then assign sequential positions
-                sorted_articles = sorted(chapter_node['children'], key=lambda x: x['order'])
+                sorted_articles = sorted(chapter_node.children, key=lambda x: x.order)
                 
                 for article_node in sorted_articles:
                     position = current_position
@@ -432,11 +731,11 @@ class VLPParser:
                     
                     self.logger.current_article += 1
                     
-                    article_title = article_node['title']
+                    article_title = article_node.title
                     
                     # Handle missing article titles
                     if not article_title:
-                        article_content = self._clean_html(article_node['content'])
+                        article_content = self._clean_html(article_node.content)
                         if "Copyright" in article_content:
                             article_title = "Copyright"
                         else:
@@ -445,16 +744,16 @@ class VLPParser:
                     self.logger.progress(f"Processing article: {article_title}")
                     
                     article = {
-                        'id': article_node['id'],
+                        'id': article_node.id,
                         'title': article_title,
-                        'vlp_order': article_node['order'],  # Keep VLP order for reference
                         'position': position,  # Sequential position for ScreenSteps
+                        'vlp_order': article_node.order,  # Keep VLP order for reference
                         'steps': []  # Store level 3 as steps
                     }
                     
                     # If Article (Level 2) has content, create a step for it first
                     # This handles cases where a Level 2 node has both content AND children
-                    article_content = self._clean_html(article_node['content'])
+                    article_content = self._clean_html(article_node.content)
                     if article_content:
                         # Create a step for the article's own content
                         intro_step = {
@@ -462,26 +761,26 @@ class VLPParser:
                             'title': article['title'],
                             'order': -1, # Ensure it comes first
                             'content': article_content,
-                            'images': article_node.get('images', [])
+                            'images': article_node.images
                         }
                         article['steps'].append(intro_step)
-                        self.logger.processed_images += len(article_node.get('images', []))
+                        self.logger.processed_images += len(article_node.images)
                     
                     # Process level 3 children as steps
-                    if article_node.get('children'):
+                    if article_node.children:
                         # Sort steps by VLP order
-                        sorted_steps = sorted(article_node['children'], key=lambda x: x['order'])
+                        sorted_steps = sorted(article_node.children, key=lambda x: x.order)
                         for step_node in sorted_steps:
                             step = {
-                                'id': step_node['id'],
-                                'title': step_node['title'],
-                                'order': step_node['order'],
-                                'content': self._clean_html(step_node['content']),
-                                'images': step_node.get('images', [])
+                                'id': step_node.id,
+                                'title': step_node.title,
+                                'order': step_node.order,
+                                'content': self._clean_html(step_node.content),
+                                'images': step_node.images
                             }
                             article['steps'].append(step)
                             # Count processed images
-                            self.logger.processed_images += len(step_node.get('images', []))
+                            self.logger.processed_images += len(step_node.images)
                     # Removed else block that only processed content if no children existed
                     # Content is now handled before children processing
                     
@@ -492,34 +791,73 @@ class VLPParser:
         
         return chapters
     
-    def _node_to_article(self, node: Dict, parent: Dict) -> Dict:
+    def _clean_html_parallel(self, manual_data: Dict) -> None:
+        """Clean the HTML of all chapters, articles and steps in worker processes and cache the results"""
+        pending = []
+        seen = set(self._clean_html_cache)
+        for chapter_node in manual_data['chapters']:
+            nodes = [chapter_node]
+            for article_node in chapter_node.children:
+                nodes.append(article_node)
+                nodes.extend(article_node.children)
+            for node in nodes:
+                html = node.content
+                if html and html not in seen:
+                    seen.add(html)
+                    pending.append(html)
+        
+        if CONVERT_WORKERS < 2 or len(pending) < PARALLEL_CONVERT_MIN:
+            return
+        
+        if FREE_THREADED:
+            # Without a GIL the parses run in parallel on threads, sharing this parser's cache
+            self.logger.substep(f"Converting {len(pending)} HTML fragments with {CONVERT_WORKERS} threads")
+            with ThreadPoolExecutor(max_workers=CONVERT_WORKERS) as executor:
+                for _ in executor.map(self._clean_html, pending):
+                    pass
+            return
+        
+        self.logger.substep(f"Converting {len(pending)} HTML fragments with {CONVERT_WORKERS} processes")
+        try:
+            with ProcessPoolExecutor(max_workers=CONVERT_WORKERS, initializer=_init_convert_worker,
+                                     initargs=(self.logger,)) as executor:
+                for html, cleaned in zip(pending, executor.map(_clean_html_worker, pending, chunksize=4)):
+                    self._clean_html_cache[html] = cleaned
+        except (OSError, BrokenProcessPool) as e:
+            # No process support (e.g. restricted sandbox): whatever is left is converted serially
+            self.logger.warning(f"Parallel HTML conversion unavailable, continuing serially: {e}")
+    
+    def _node_to_article(self, node: ContentNode, parent: Dict) -> Dict:
         """Convert a VLP node to a ScreenSteps article"""
+        now = self._now_iso
         return {
-            'id': node['id'],
-            'title': node['title'],
-            'order': node['order'],
-            'content': self._clean_html(node['content']),
-            'html_body': node['content'],
-            'images': node.get('images', []),
+            'id': node.id,
+            'title': node.title,
+            'order': node.order,
+            'content': self._clean_html(node.content),
+            'html_body': node.content,
+            'images': node.images,
             'parent_title': parent.get('title', ''),
-            'meta_title': node['title'],
-            'meta_description': self._extract_description(node['content']),
-            'created_at': datetime.now().isoformat(),
-            'last_edited_at': datetime.now().isoformat()
+            'meta_title': node.title,
+            'meta_description': extract_description(node.content),
+            'created_at': now,
+            'last_edited_at': now
         }
     
     def _clean_html(self, html: str) -> str:
         """Clean up and convert VLP HTML to ScreenSteps-compatible HTML."""
         if not html:
             return ""
+        cleaned = self._clean_html_cache.get(html)
+        if cleaned is None:
+            # Parse and convert VLP-specific formatting to standard HTML
+            cleaned = self._convert_vlp_formatting(html)
 
-        # Parse and convert VLP-specific formatting to standard HTML
-        html = self._convert_vlp_formatting(html)
+            # Fix image paths - remove ./ prefix
+            cleaned = RELATIVE_SRC_RE.sub('src="', cleaned).strip()
+            self._clean_html_cache[html] = cleaned
 
-        # Fix image paths - remove ./ prefix
-        html = re.sub(r'src=["\']\./', 'src="', html)
-
-        return html.strip()
+        return cleaned
     
     def _convert_vlp_formatting(self, html: str) -> str:
         """Convert VLP-specific span classes to proper HTML formatting tags
@@ -536,7 +874,7 @@ class VLPParser:
         verbose = hasattr(self, 'verbose') and self.verbose
 
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = parse_html_fragment(html)
             # Use BeautifulSoup to parse and transform the HTML
             
             # Convert YouTube embeds first (before other transformations)
@@ -625,30 +963,22 @@ class VLPParser:
                 
                 # Apply transformation or unwrap
                 if replacement_tag:
-                    # Create new tag with the same content
-                    new_tag = soup.new_tag(replacement_tag)
-                    # Preserve the inner content (including nested tags and text)
-                    new_tag.extend(span.contents)
-                    # Replace the span with the new tag
-                    span.replace_with(new_tag)
+                    # Retag the span in place; its content (nested tags and text) stays put
+                    span.name = replacement_tag
+                    span.attrs.clear()
                 else:
                     # Unwrap all non-mapped spans to preserve content without wrapper
                     span.unwrap()
             
-            # Convert back to string first
-            html = str(soup)
-            
             # Convert VLP paragraph classes to ScreenSteps formatted blocks
-            html = self._convert_vlp_paragraph_styles(html)
+            self._convert_vlp_paragraph_styles(soup)
             
-            # Use the result from paragraph styles conversion
-            result = html
-            
-            # Clean up any remaining empty spans
-            result = re.sub(r'<span[^>]*>\s*</span>', '', result)
+            # Clean up any remaining empty spans (only whitespace text inside)
+            for span in soup.find_all('span'):
+                if all(type(child) is NavigableString and not child.strip() for child in span.contents):
+                    span.decompose()
             
             # Normalize <ol> start attributes and handle nested lists
-            soup = BeautifulSoup(result, 'html.parser')
             for ol_tag in soup.find_all('ol'):
                 if ol_tag.has_attr('start'):
                     del ol_tag['start']
@@ -669,7 +999,8 @@ class VLPParser:
                             elif cls.endswith('-2'):
                                 ol_tag['type'] = 'i'
                                 ol_tag['style'] = 'margin-left: 80px; list-style-type: upper-latin;'
-            result = str(soup)
+            # All passes share one parse tree; serialize it once
+            result = fragment_to_html(soup)
 
             return result
             
@@ -681,93 +1012,62 @@ class VLPParser:
                 self.logger.warning(f"Traceback: {traceback.format_exc()}")
             return html
     
-    def _convert_vlp_paragraph_styles(self, html_content: str) -> str:
-        """Convert VLP paragraph classes to ScreenSteps formatted blocks."""
-        if not html_content:
-            return ""
-
-        p_class_to_style_map = {
-            # NOTE: CSS classes like c10, c44, c48, etc. are document-specific and NOT reliable
-            # indicators of styled blocks. They are used for regular paragraph formatting (indentation,
-            # alignment, etc.) and should NOT be mapped to ScreenSteps styled blocks.
-            # 
-            # Styled blocks should only be applied based on semantic HTML structure or explicit
-            # content patterns, not generic CSS classes from Google Docs exports.
-            # Add mappings here ONLY if you identify a truly consistent semantic pattern.
-        }
+    def _convert_vlp_paragraph_styles(self, soup: BeautifulSoup) -> None:
+        """Convert VLP paragraph classes to ScreenSteps formatted blocks in place."""
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        p_class_to_style_map = PARAGRAPH_CLASS_STYLES
+        if not p_class_to_style_map:
+            return
         
         # Note: We do NOT apply styling to table cells (thead/tbody/td/th)
         # Tables should be preserved as-is with their native HTML structure
         # The ScreenSteps API will handle table rendering properly
         
-        # Use a copy of the list of tags to iterate over, as we are modifying the tree
-        # Filter to ensure only valid Tag objects are included
-        all_p_tags = [p for p in soup.find_all('p') if p is not None and isinstance(p, Tag)]
-        processed_tags = set()
-
-        for p_class, style in p_class_to_style_map.items():
-            # Find all tags with the current class, EXCLUDING those inside tables
-            # Also skip tags that have been removed from the tree (parent is None)
-            tags_with_class = [
-                p for p in all_p_tags 
-                if p.parent  # Skip if tag was removed/extracted from tree
-                and (p_classes := p.get('class')) and p_class in p_classes and p not in processed_tags
-                and not p.find_parent('table')  # Skip paragraphs inside tables
-            ]
+        # Single left-to-right scan: each paragraph starts a group with its first mapped class
+        # (in map order) and the group takes the following siblings carrying that class
+        grouped = set()
+        for start_tag in soup.find_all('p'):
+            # Skip tags already grouped or removed from the tree, and paragraphs inside tables
+            if start_tag in grouped or not start_tag.parent or start_tag.find_parent('table'):
+                continue
+            p_classes = start_tag.get('class') or ()
+            p_class = next((cls for cls in p_class_to_style_map if cls in p_classes), None)
+            if p_class is None:
+                continue
             
-            i = 0
-            while i < len(tags_with_class):
-                start_tag = tags_with_class[i]
-                if start_tag in processed_tags:
-                    i += 1
-                    continue
-
-                group = [start_tag]
-                processed_tags.add(start_tag)
-                
-                # Find consecutive siblings with the same class
-                next_sibling = start_tag.find_next_sibling()
-                while next_sibling and isinstance(next_sibling, Tag) and next_sibling.has_attr('class'):
-                    sibling_classes = next_sibling.get('class')
-                    if sibling_classes and p_class in sibling_classes:
-                        if next_sibling in processed_tags:
-                            break # Stop if we hit a tag that's already part of another group
-                        group.append(next_sibling)
-                        processed_tags.add(next_sibling)
-                        next_sibling = next_sibling.find_next_sibling()
-                    else:
-                        break
+            group = [start_tag]
+            grouped.add(start_tag)
+            
+            # Find consecutive siblings with the same class
+            next_sibling = start_tag.find_next_sibling()
+            while next_sibling is not None and next_sibling not in grouped:
+                sibling_classes = next_sibling.get('class')
+                if not sibling_classes or p_class not in sibling_classes:
+                    break
+                group.append(next_sibling)
+                grouped.add(next_sibling)
+                next_sibling = next_sibling.find_next_sibling()
 
-                # Filter out empty paragraphs and paragraphs that contain ONLY images (no text)
-                # Styled blocks should only contain text content, not standalone images
-                content_tags = [p for p in group if p and p.get_text(strip=True)]
-                
-                if content_tags:
-                    # Create the styled div and insert it into the tree *before* the start tag.
-                    styled_div = soup.new_tag('div')
-                    styled_div['class'] = 'screensteps-styled-block'
-                    styled_div['data-style'] = style
-                    start_tag.insert_before(styled_div)
+            # Filter out empty paragraphs and paragraphs that contain ONLY images (no text)
+            # Styled blocks should only contain text content, not standalone images
+            content_tags = [p for p in group if p.get_text(strip=True)]
+            
+            if content_tags:
+                # Create the styled div and insert it into the tree *before* the start tag.
+                styled_div = soup.new_tag('div')
+                styled_div['class'] = 'screensteps-styled-block'
+                styled_div['data-style'] = p_class_to_style_map[p_class]
+                start_tag.insert_before(styled_div)
 
-                    # Move the content tags into the new div
-                    for tag in content_tags:
-                        if tag and tag.parent:  # Only extract if tag is valid and still in tree
-                            styled_div.append(tag.extract())
-                
-                # Decompose only truly empty tags (no text and no images)
-                # Leave image-only paragraphs in place so they can be processed as separate content blocks
-                for tag in group:
-                    if tag and tag.parent and tag not in content_tags:
-                        # Only decompose if the tag has no images
-                        if not tag.find('img'):
-                            tag.decompose()
-                
-                # Move to the next unprocessed tag
-                i += len(group)
-                
-        return str(soup)
+                # Move the content tags into the new div
+                for tag in content_tags:
+                    styled_div.append(tag.extract())
+            
+            # Decompose only truly empty tags (no text and no images)
+            # Leave image-only paragraphs in place so they can be processed as separate content blocks
+            for tag in group:
+                if tag not in content_tags and not tag.find('img'):
+                    tag.decompose()
     
     def _convert_youtube_embeds(self, soup: BeautifulSoup) -> None:
         """Convert VLP YouTube embed divs to ScreenSteps iframe format"""
@@ -783,7 +1083,7 @@ class VLPParser:
                 thumb_url = youtube_div.get('data-thumb-url')
                 if thumb_url:
                     thumb_url_str = str(thumb_url) if not isinstance(thumb_url, str) else thumb_url
-                    match = re.search(r'youtube\.com/vi/([^/]+)/', thumb_url_str)
+                    match = YOUTUBE_THUMB_ID_RE.search(thumb_url_str)
                     if match:
                         video_id = match.group(1)
             
@@ -813,27 +1113,30 @@ class VLPParser:
                 self.logger.substep(f"Converted YouTube embed: {video_id}")
             else:
                 self.logger.warning("Found YouTube embed div but could not extract video ID")
-    
-    def _extract_description(self, html: str, max_length: int = 200) -> str:
-        """Extract plain text description from HTML"""
-        if not html:
-            return ""
-        
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', html)
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        if len(text) > max_length:
-            text = text[:max_length] + "..."
-        
-        return text
+
+# Parser of a conversion worker process, created by _init_convert_worker
+_worker_parser = None
+
+def _init_convert_worker(logger: ProgressLogger):
+    """Process pool initializer: build the worker's parser around a copy of the main logger"""
+    global _worker_parser
+    logger.use_direct_file_logging()
+    _worker_parser = VLPParser(logger)
+
+def _clean_html_worker(html: str) -> str:
+    """Clean one HTML fragment in a worker process"""
+    return _worker_parser._clean_html(html)
 
 class ScreenStepsConverter:
     """Converter from VLP to ScreenSteps format"""
     
-    def __init__(self, logger: ProgressLogger):
+    def __init__(self, logger: ProgressLogger, hardlink_images: bool = False, pretty_json: bool = False):
         self.logger = logger
+        # Link output images to the source files instead of copying them (same filesystem only)
+        self.hardlink_images = hardlink_images
+        # Indent the output JSON for human inspection; the uploader doesn't need it
+        self.pretty_json = pretty_json
+        self._now_iso = datetime.now().isoformat()
     
     def convert(self, vlp_data: Dict, chapters: List[Dict], 
                 output_dir: Path, images_dir: Path) -> Dict:
@@ -841,41 +1144,20 @@ class ScreenStepsConverter:
         
         self.logger.info("Converting to ScreenSteps format...")
         
-        # Create ScreenSteps manual structure
+        # Create ScreenSteps manual structure; flatten_structure already builds the chapters and
+        # articles (with steps) in ScreenSteps layout, so they are used as they are
+        now = self._now_iso
         manual = {
             'manual': {
                 'id': vlp_data['id'],
                 'title': vlp_data['name'],
                 'language': vlp_data['language'],
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat(),
-                'chapters': []
+                'created_at': now,
+                'updated_at': now,
+                'chapters': chapters
             }
         }
         
-        # Convert chapters
-        for chapter in chapters:
-            ss_chapter = {
-                'id': chapter['id'],
-                'title': chapter['title'],
-                'order': chapter['order'],
-                'description': chapter.get('description', ''),
-                'articles': []
-            }
-            
-            # Convert articles (with steps)
-            for article in chapter['articles']:
-                ss_article = {
-                    'id': article['id'],
-                    'title': article['title'],
-                    'position': article['position'],  # Sequential position for ScreenSteps
-                    'vlp_order': article.get('vlp_order'),  # Keep VLP order for reference
-                    'steps': article.get('steps', [])  # Include steps
-                }
-                ss_chapter['articles'].append(ss_article)
-            
-            manual['manual']['chapters'].append(ss_chapter)
-        
         self.logger.success(f"Converted {len(chapters)} chapters with articles")
         
         return manual
@@ -894,36 +1176,63 @@ class ScreenStepsConverter:
         
         # Write table of contents
         toc_file = output_dir / f"{manual['manual']['id']}.json"
-        with open(toc_file, 'w', encoding='utf-8') as f:
-            json.dump(manual, f, indent=2, ensure_ascii=False)
+        write_json_file(toc_file, manual, self.pretty_json)
         self.logger.substep(f"Created TOC: {toc_file.name}")
         
+        # Create every article image directory up front, once per unique directory
+        article_image_dirs = {images_dir / article['id']
+                              for chapter in manual['manual']['chapters'] for article in chapter['articles']}
+        for article_images_dir in article_image_dirs:
+            article_images_dir.mkdir(exist_ok=True)
+        
         # Write individual articles and count images
         article_count = 0
-        image_count = 0
+        # Article files to write, destination -> source of the images to copy
+        # (a later step with the same file name wins), and step references per source
+        article_files = []
+        image_copies = {}
+        image_refs = {}
+        
         for chapter in manual['manual']['chapters']:
             for article in chapter['articles']:
                 article_id = article['id']
                 
-                # Write article JSON (with steps)
-                article_file = articles_dir / f"{article_id}.json"
-                with open(article_file, 'w', encoding='utf-8') as f:
-                    json.dump(article, f, indent=2, ensure_ascii=False)
+                # Article JSON (with steps)
+                article_files.append((articles_dir / f"{article_id}.json", article))
                 
-                # Copy article images from steps
+                # Collect article images from steps
                 article_images_dir = images_dir / article_id
-                article_images_dir.mkdir(exist_ok=True)
                 
                 for step in article.get('steps', []):
                     for img_info in step.get('images', []):
                         src_image = images_source / img_info['filename']
-                        if src_image.exists():
-                            dst_image = article_images_dir / src_image.name
-                            shutil.copy2(src_image, dst_image)
-                            image_count += 1
+                        image_copies[article_images_dir / src_image.name] = src_image
+                        image_refs[src_image] = image_refs.get(src_image, 0) + 1
                 
                 article_count += 1
         
+        # Screenshots shared by several articles are handled as one task per source image
+        destinations_by_source = {}
+        for dst_image, src_image in image_copies.items():
+            destinations_by_source.setdefault(src_image, []).append(dst_image)
+        
+        def copy_image(item) -> bool:
+            # No stat per image up front: a missing source shows up as FileNotFoundError and is skipped
+            try:
+                _copy_to_all(*item, hardlink=self.hardlink_images)
+            except FileNotFoundError:
+                return False
+            return True
+        
+        # Write the articles and copy the images concurrently; only the image bytes matter, not the file metadata
+        with ThreadPoolExecutor(max_workers=OUTPUT_WORKERS) as executor:
+            writes = executor.map(lambda pair: write_json_file(*pair, self.pretty_json), article_files)
+            copies = executor.map(copy_image, destinations_by_source.items())
+            list(writes)
+            copied = list(copies)
+        image_count = sum(image_refs[src_image]
+                          for src_image, ok in zip(destinations_by_source, copied) if ok)
+        
         self.logger.substep(f"Created {article_count} article files with {image_count} images")
         self.logger.success(f"Output written to: {output_dir}")
         
@@ -932,11 +1241,11 @@ class ScreenStepsConverter:
 class VLPToScreenStepsConverter:
     """Main converter class"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, hardlink_images: bool = False, pretty_json: bool = False):
         self.verbose = verbose
         self.logger = ProgressLogger(verbose)
         self.parser = VLPParser(self.logger)
-        self.converter = ScreenStepsConverter(self.logger)
+        self.converter = ScreenStepsConverter(self.logger, hardlink_images, pretty_json)
     
     def convert_zip(self, zip_path: Path, output_dir: Path, 
                     cleanup: bool = True) -> Path:
@@ -981,7 +1290,8 @@ class VLPToScreenStepsConverter:
         # Cleanup
         if cleanup:
             self.logger.info("Cleaning up temporary files...")
-            shutil.rmtree(temp_dir)
+            # Nothing reads the extracted files any more; unlinking them need not hold up the summary
+            _rmtree_in_background(temp_dir)
         
         self.logger.header("Conversion Complete!")
         self.logger.success(f"ScreenSteps content created at: {output_path}")
@@ -1039,24 +1349,58 @@ class VLPToScreenStepsConverter:
         
         self.logger.substep(f"Extracting to: {temp_dir}")
         
+        # Create all directories serially, then extract the files in parallel shards
+        members = {}
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-        
-        # Find the actual content directory (may be nested)
-        content_xml = None
-        for root, dirs, files in os.walk(temp_dir):
-            if 'content.xml' in files:
-                content_xml = Path(root)
-                break
-        
-        if content_xml and content_xml != temp_dir:
-            # Move contents up if nested
-            for item in content_xml.iterdir():
-                shutil.move(str(item), str(temp_dir / item.name))
-        
-        self.logger.substep(f"Extracted {len(list(temp_dir.rglob('*')))} files")
+            entries = [(info, self._zip_member_parts(info.filename)) for info in zip_ref.infolist()]
+        
+        # The content may be nested in a folder: extract the folder holding the topmost
+        # content.xml straight into temp_dir instead of moving its files up afterwards
+        content_dirs = [parts[:-1] for info, parts in entries
+                        if parts and parts[-1] == 'content.xml' and not info.is_dir()]
+        prefix = min(content_dirs, key=len) if content_dirs else []
+        
+        for info, parts in entries:
+            if prefix and parts[:len(prefix)] == prefix:
+                parts = parts[len(prefix):]
+            if not parts:
+                continue
+            target = temp_dir.joinpath(*parts)
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # A later entry with the same name overwrites an earlier one, as with extractall
+            members[target] = info
+        
+        members = list(members.items())
+        workers = min(ZIP_EXTRACT_WORKERS, len(members))
+        if workers:
+            shards = [members[i::workers] for i in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda shard: self._extract_members(zip_path, shard), shards))
+        
+        self.logger.substep(f"Extracted {len(members)} files")
         
         return temp_dir
+    
+    @staticmethod
+    def _extract_members(zip_path: Path, members: List[Tuple[Path, zipfile.ZipInfo]]):
+        """Extract the given members to their target paths using a private handle on the archive"""
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            for target, info in members:
+                with zip_ref.open(info) as src, open(target, 'wb', buffering=ZIP_COPY_BUFFER) as dst:
+                    shutil.copyfileobj(src, dst, length=ZIP_COPY_BUFFER)
+    
+    @staticmethod
+    def _zip_member_parts(member_name: str) -> List[str]:
+        """Sanitized path components of a ZIP member, same rules as ZipFile.extractall"""
+        arcname = member_name.replace('/', os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        # Drop drive letters, absolute roots and '.'/'..' components
+        arcname = os.path.splitdrive(arcname)[1]
+        return [part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
 
 def print_usage_examples():
     """Print detailed usage examples"""
@@ -1128,6 +1472,10 @@ def main():
                        help='Enable verbose logging')
     parser.add_argument('--no-cleanup', action='store_true',
                        help='Keep temporary files after conversion')
+    parser.add_argument('--hardlink-images', action='store_true',
+                       help='Hardlink output images to the extracted/input images instead of copying them')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Write indented JSON output (default: compact)')
     parser.add_argument('--version', action='version',
                        version=f'vlp2ss-py v{APP_VERSION}')
     parser.add_argument('--examples', action='store_true',
@@ -1146,11 +1494,10 @@ def main():
         return 0
     
     # --- Print Header ---
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'VLP to ScreenSteps Converter'.center(70)}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{f'Version: {APP_VERSION}'.center(70)}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.ENDC}\n")
+    print(f"{HEADER_BAR}\n{Colors.HEADER}{Colors.BOLD}{'VLP to ScreenSteps Converter'.center(70)}{Colors.ENDC}")
+    print(f"{Colors.HEADER}{Colors.BOLD}{f'Version: {APP_VERSION}'.center(70)}{Colors.ENDC}\n{HEADER_BAR}\n")
     
+    converter = None
     try:
         start_time = time.time()
         
@@ -1161,17 +1508,18 @@ def main():
             print(f"{Colors.FAIL}Error: Input path does not exist: {input_path}{Colors.ENDC}")
             return 1
         
-        # Clean logs and output directories at startup
+        # Clean logs and output directories at startup; the old trees are deleted while this run works
         logs_dir = Path("logs")
         if logs_dir.exists():
-            shutil.rmtree(logs_dir)
+            _discard_tree(logs_dir)
         logs_dir.mkdir(exist_ok=True)
         
         if output_dir.exists():
-            shutil.rmtree(output_dir)
+            _discard_tree(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        converter = VLPToScreenStepsConverter(verbose=args.verbose)
+        converter = VLPToScreenStepsConverter(verbose=args.verbose, hardlink_images=args.hardlink_images,
+                                              pretty_json=args.pretty)
         
         if input_path.is_file() and input_path.suffix == '.zip':
             converter.convert_zip(input_path, output_dir, 
@@ -1195,6 +1543,9 @@ def main():
         print(f"{Colors.FAIL}Error: {e}{Colors.ENDC}")
         logging.exception("Conversion failed")
         return 1
+    finally:
+        if converter is not None:
+            converter.logger.close()
 
 if __name__ == "__main__":
     sys.exit(main())